@@ -39,8 +39,6 @@ autodoc_mock_imports = [
     "plotly.graph_objects",
     "matplotlib",
     "matplotlib.pyplot",
-    "scipy",
-    "scipy.stats",
     "eelbrain",
 ]
 
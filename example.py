@@ -9,10 +9,9 @@ This script shows different ways to use the brain visualization package:
 4. Jupyter notebook display
 """
 
-import numpy as np
 from eelbrain_plotly_viz import EelbrainPlotly2DViz
 try:
-    from eelbrain import datasets, NDVar
+    from eelbrain import datasets
     EELBRAIN_AVAILABLE = True
 except ImportError:
     EELBRAIN_AVAILABLE = False
@@ -10,11 +10,15 @@ from typing import Tuple, Dict, Any, Optional
 
 
 class _SampleTimeDim:
+    __slots__ = ("times",)
+
     def __init__(self, times: np.ndarray):
         self.times = times
 
 
 class _SampleSourceDim:
+    __slots__ = ("coordinates", "parc")
+
     def __init__(self, coordinates: np.ndarray, parc: Optional[Any] = None):
         self.coordinates = coordinates
         self.parc = parc
@@ -50,6 +54,15 @@ class SampleDataNDVar(dict):
         self.has_case = False  # sample data has no case dimension
         self.time = _SampleTimeDim(times)
         self.source = _SampleSourceDim(coords)
+        # Data for each supported dimension order (transposes are views)
+        if has_vector_data:
+            # Stored as (n_sources, n_times, 3)
+            self._data_by_order = {
+                ("source", "space", "time"): np.transpose(data, (0, 2, 1)),
+                ("source", "time", "space"): data,
+            }
+        else:
+            self._data_by_order = {("source", "time"): data}
 
     def mean(self, *_, **__):
         # No case dimension; return self
@@ -71,17 +84,11 @@ class SampleDataNDVar(dict):
         # Expected orders:
         # - ("source", "space", "time") for vector data
         # - ("source", "time") for scalar data
-        if self.has_vector_data:
-            # Stored as (n_sources, n_times, 3); transpose if needed
-            if order == ("source", "space", "time"):
-                return np.transpose(self._data, (0, 2, 1))
-            if order == ("source", "time", "space"):
-                return self._data
-            raise ValueError(f"Unsupported order {order} for vector data")
-        else:
-            if order == ("source", "time"):
-                return self._data
-            raise ValueError(f"Unsupported order {order} for scalar data")
+        data = self._data_by_order.get(order)
+        if data is None:
+            kind = "vector" if self.has_vector_data else "scalar"
+            raise ValueError(f"Unsupported order {order} for {kind} data")
+        return data
 
 
 def create_sample_brain_data(
@@ -111,28 +118,29 @@ def create_sample_brain_data(
         ``data`` (array), ``coords`` (array), ``times`` (array),
         ``has_vector_data`` (bool), ``n_sources`` (int), ``n_times`` (int).
     """
-    np.random.seed(random_seed)
+    # Local generator: reproducible without touching NumPy's global RNG state
+    rng = np.random.default_rng(random_seed)
 
     # Create realistic brain-like coordinates
     # Simulate brain volume roughly within [-0.08, 0.08] meters
-    coords = _create_brain_coordinates(n_sources)
+    coords = _create_brain_coordinates(n_sources, rng)
 
     # Create time values (0 to 0.5 seconds)
     times = np.linspace(0, 0.5, n_times)
 
     if has_vector_data:
         # Create vector data (n_sources, n_times, 3)
-        data = _create_vector_brain_activity(n_sources, n_times, coords, times)
+        data = _create_vector_brain_activity(n_sources, n_times, coords, times, rng)
     else:
         # Create scalar data (n_sources, n_times)
-        data = _create_scalar_brain_activity(n_sources, n_times, coords, times)
+        data = _create_scalar_brain_activity(n_sources, n_times, coords, times, rng)
 
     return SampleDataNDVar(
         data=data, coords=coords, times=times, has_vector_data=has_vector_data
     )
 
 
-def _create_brain_coordinates(n_sources: int) -> np.ndarray:
+def _create_brain_coordinates(n_sources: int, rng: np.random.Generator) -> np.ndarray:
     """Create realistic brain-like 3D coordinates."""
     # Create coordinates that roughly follow brain shape
     coords = np.zeros((n_sources, 3))
@@ -140,47 +148,51 @@ def _create_brain_coordinates(n_sources: int) -> np.ndarray:
     # Generate coordinates in layers (axial slices)
     n_layers = 8
     sources_per_layer = n_sources // n_layers
+    n_layered = n_layers * sources_per_layer
+    layer = np.repeat(np.arange(n_layers), sources_per_layer)
 
-    for layer in range(n_layers):
-        start_idx = layer * sources_per_layer
-        end_idx = min((layer + 1) * sources_per_layer, n_sources)
-        n_layer_sources = end_idx - start_idx
+    # Z coordinate (superior-inferior): -0.04 to 0.06 meters
+    z = -0.04 + (layer / (n_layers - 1)) * 0.10
 
-        # Z coordinate (superior-inferior): -0.04 to 0.06 meters
-        z = -0.04 + (layer / (n_layers - 1)) * 0.10
+    # Create roughly brain-shaped cross-sections at each Z level
+    # Use a combination of sphere and ellipsoid
+    theta = rng.uniform(0, 2 * np.pi, n_layered)
+    phi = rng.uniform(0, np.pi, n_layered)
 
-        # Create roughly brain-shaped cross-section at this Z level
-        # Use a combination of sphere and ellipsoid
-        for i in range(n_layer_sources):
-            # Random angle
-            theta = np.random.uniform(0, 2 * np.pi)
-            phi = np.random.uniform(0, np.pi)
+    # Brain-like radial distance (smaller at top and bottom)
+    brain_factor = 0.5 + 0.5 * np.cos(phi)  # Smaller at poles
+    radius = rng.uniform(0.02, 0.08, n_layered) * brain_factor
 
-            # Brain-like radial distance (smaller at top and bottom)
-            brain_factor = 0.5 + 0.5 * np.cos(phi)  # Smaller at poles
-            radius = np.random.uniform(0.02, 0.08) * brain_factor
-
-            # Convert to Cartesian (roughly brain-shaped)
-            x = radius * np.sin(phi) * np.cos(theta) * 0.8  # Slightly flattened
-            y = radius * np.sin(phi) * np.sin(theta) * 1.2  # Elongated front-back
-
-            coords[start_idx + i] = [x, y, z]
+    # Convert to Cartesian (roughly brain-shaped)
+    coords[:n_layered, 0] = radius * np.sin(phi) * np.cos(theta) * 0.8  # Flattened
+    coords[:n_layered, 1] = radius * np.sin(phi) * np.sin(theta) * 1.2  # Elongated
+    coords[:n_layered, 2] = z
 
     return coords
 
 
 def _create_scalar_brain_activity(
-    n_sources: int, n_times: int, coords: np.ndarray, times: np.ndarray
+    n_sources: int,
+    n_times: int,
+    coords: np.ndarray,
+    times: np.ndarray,
+    rng: np.random.Generator,
 ) -> np.ndarray:
     """Create realistic scalar brain activity patterns."""
-    data = np.zeros((n_sources, n_times))
+    # Baseline noise, drawn straight into the output buffer
+    data = np.empty((n_sources, n_times))
+    rng.standard_normal(out=data)
+    data *= 0.05
+
+    # Reusable buffer for the per-pattern noise
+    noise = np.empty((n_sources, n_times))
 
     # Create multiple activity patterns
     n_patterns = 3
 
     for pattern in range(n_patterns):
         # Random center of activity
-        center = coords[np.random.randint(0, n_sources)]
+        center = coords[rng.integers(0, n_sources)]
 
         # Time course (Gaussian pulse)
         peak_time = 0.1 + pattern * 0.15
@@ -188,52 +200,52 @@ def _create_scalar_brain_activity(
         time_course = np.exp(-0.5 * ((times - peak_time) / time_width) ** 2)
 
         # Spatial pattern (distance-based decay)
-        for i, coord in enumerate(coords):
-            distance = np.linalg.norm(coord - center)
-            spatial_decay = np.exp(-distance / 0.03)  # 3cm decay
-
-            # Add noise and scale
-            amplitude = spatial_decay * np.random.uniform(0.5, 2.0)
-            noise = np.random.normal(0, 0.1, n_times)
+        distance = np.linalg.norm(coords - center, axis=1)
+        spatial_decay = np.exp(-distance / 0.03)  # 3cm decay
 
-            data[i] += amplitude * time_course + noise
+        # Add noise and scale
+        amplitude = spatial_decay * rng.uniform(0.5, 2.0, n_sources)
+        rng.standard_normal(out=noise)
+        noise *= 0.1
 
-    # Add baseline noise
-    data += np.random.normal(0, 0.05, (n_sources, n_times))
+        data += noise
+        data += amplitude[:, np.newaxis] * time_course
 
     return data
 
 
 def _create_vector_brain_activity(
-    n_sources: int, n_times: int, coords: np.ndarray, times: np.ndarray
+    n_sources: int,
+    n_times: int,
+    coords: np.ndarray,
+    times: np.ndarray,
+    rng: np.random.Generator,
 ) -> np.ndarray:
     """Create realistic vector brain activity patterns."""
-    data = np.zeros((n_sources, n_times, 3))
-
     # Create scalar activity first
-    scalar_activity = _create_scalar_brain_activity(n_sources, n_times, coords, times)
-
-    # Convert to vector activity with realistic orientations
-    for i, coord in enumerate(coords):
-        for t in range(n_times):
-            magnitude = abs(scalar_activity[i, t])
-
-            if magnitude > 0.1:  # Only create vectors for significant activity
-                # Create somewhat realistic dipole orientations
-                # Tend to point radially outward from brain center
-                direction = coord / (np.linalg.norm(coord) + 1e-6)
-
-                # Add some randomness to direction
-                random_perturbation = np.random.normal(0, 0.3, 3)
-                direction = direction + random_perturbation
-                direction = direction / (np.linalg.norm(direction) + 1e-6)
-
-                # Scale by magnitude
-                data[i, t] = direction * magnitude
-            else:
-                # Small random vectors for noise
-                data[i, t] = np.random.normal(0, 0.02, 3)
-
+    scalar_activity = _create_scalar_brain_activity(
+        n_sources, n_times, coords, times, rng
+    )
+    magnitude = np.abs(scalar_activity)[:, :, np.newaxis]
+
+    # Create somewhat realistic dipole orientations
+    # Tend to point radially outward from brain center
+    direction = coords / (np.linalg.norm(coords, axis=1, keepdims=True) + 1e-6)
+
+    # Add some randomness to direction; everything below works in place on
+    # this buffer, which becomes the returned data
+    data = np.empty((n_sources, n_times, 3))
+    rng.standard_normal(out=data)
+    data *= 0.3
+    data += direction[:, np.newaxis, :]
+    data /= np.linalg.norm(data, axis=2, keepdims=True) + 1e-6
+
+    # Scale by magnitude for significant activity, small random vectors for noise
+    data *= magnitude
+    noise = np.empty((n_sources, n_times, 3))
+    rng.standard_normal(out=noise)
+    noise *= 0.02
+    np.copyto(data, noise, where=magnitude <= 0.1)
     return data
 
 
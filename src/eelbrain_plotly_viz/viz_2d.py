@@ -1,15 +1,14 @@
 import base64
+import functools
 import io
 import random
-from typing import Optional, Union, List, Dict, Any
+from typing import Optional, Union, List, Dict, Any, Tuple
 
 import dash
 import matplotlib.pyplot as plt
 import numpy as np
 import plotly.graph_objects as go
-import plotly.figure_factory as ff
-from dash import dcc, html, Input, Output, State
-from scipy.stats import binned_statistic_2d
+from dash import dcc, html, Input, Output, State, Patch
 
 from eelbrain import set_parc, NDVar, datasets
 
@@ -27,6 +26,194 @@ def _is_jupyter_environment():
 
 JUPYTER_AVAILABLE = _is_jupyter_environment()
 
+# External CSS to remove ALL default margins/padding from Dash containers
+_EXTERNAL_STYLESHEETS = [
+    {
+        "href": "data:text/css;charset=utf-8,"
+        + "*{box-sizing:border-box;}"
+        + "html{margin:0!important;padding:0!important;height:auto!important;overflow:hidden;}"
+        + "body{margin:0!important;padding:0!important;height:auto!important;overflow:hidden;}"
+        + "#react-entry-point{margin:0!important;padding:0!important;height:auto!important;}"
+        + "#_dash-app-content{margin:0!important;padding:0!important;height:auto!important;}"
+        + "._dash-loading{margin:0!important;padding:0!important;}",
+        "rel": "stylesheet",
+    }
+]
+
+
+# Maximum number of points per butterfly trace sent to the browser
+BUTTERFLY_MAX_POINTS = 2000
+
+
+def _vector_norm(data: np.ndarray) -> np.ndarray:
+    """Euclidean norm over the space axis (axis 1) of vector data.
+
+    Equivalent to ``np.linalg.norm(data, axis=1)``, but sums the squares in a
+    single pass without allocating a squared copy of ``data``.
+
+    Parameters
+    ----------
+    data
+        Array with the space dimension on axis 1, e.g. ``(n_sources, 3,
+        n_times)`` or ``(n_sources, 3)``.
+
+    Returns
+    -------
+    np.ndarray
+        Norms with axis 1 removed.
+    """
+    if not np.issubdtype(data.dtype, np.floating):
+        data = data.astype(float)
+    squared = np.einsum("ij...,ij...->i...", data, data)
+    return np.sqrt(squared, out=squared)
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Select points for downsampling a line with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last point and, for each of ``n_out - 2`` equally sized
+    buckets in between, the point forming the largest triangle with the
+    previously selected point and the mean of the next bucket. This preserves
+    peaks much better than plain decimation.
+
+    Parameters
+    ----------
+    x, y
+        Line coordinates (``x`` sorted in ascending order).
+    n_out
+        Number of points to keep.
+
+    Returns
+    -------
+    np.ndarray
+        Sorted indices of the points to keep (all indices if the line already
+        has ``n_out`` points or fewer).
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    # Bucket boundaries for the inner points 1 .. n - 2
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    indices = np.empty(n_out, dtype=int)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    selected = 0
+    for bucket in range(n_out - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_start, next_stop = stop, edges[bucket + 2]
+        else:
+            next_start, next_stop = n - 1, n
+        next_x = x[next_start:next_stop].mean()
+        next_y = y[next_start:next_stop].mean()
+
+        # Twice the triangle area for each candidate point in this bucket
+        areas = np.abs(
+            (x[selected] - next_x) * (y[start:stop] - y[selected])
+            - (x[selected] - x[start:stop]) * (next_y - y[selected])
+        )
+        selected = start + int(np.argmax(areas))
+        indices[bucket + 1] = selected
+
+    return indices
+
+
+def _build_quiver_segments(
+    x: np.ndarray,
+    y: np.ndarray,
+    u: np.ndarray,
+    v: np.ndarray,
+    scale: float,
+    head_size: float = 0.3,
+    head_angle: float = np.pi / 9,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute quiver arrows as flat, NaN-separated line segment arrays.
+
+    Uses the same geometry as ``plotly.figure_factory.create_quiver``: each
+    arrow is a shaft from ``(x, y)`` to ``(x + u * scale, y + v * scale)`` and a
+    two-sided head whose length is ``head_size`` times the shaft length.
+
+    Parameters
+    ----------
+    x, y
+        Arrow start points.
+    u, v
+        Arrow vector components.
+    scale
+        Scale factor applied to ``u`` and ``v``.
+    head_size
+        Arrow head length relative to the shaft length.
+    head_angle
+        Angle between the shaft and each side of the arrow head (radians).
+
+    Returns
+    -------
+    tuple of np.ndarray
+        ``(xs, ys)`` with all shafts followed by all heads, separated by NaN.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    x_end = x + np.asarray(u) * scale
+    y_end = y + np.asarray(v) * scale
+
+    # Arrow heads: two barbs rotated by +/- head_angle from the shaft direction
+    shaft_angle = np.arctan2(y_end - y, x_end - x)
+    head_length = np.hypot(x_end - x, y_end - y) * head_size
+    head1_x = x_end - head_length * np.cos(shaft_angle + head_angle)
+    head1_y = y_end - head_length * np.sin(shaft_angle + head_angle)
+    head2_x = x_end - head_length * np.cos(shaft_angle - head_angle)
+    head2_y = y_end - head_length * np.sin(shaft_angle - head_angle)
+
+    gaps = np.full_like(x_end, np.nan)
+    xs = np.concatenate(
+        [
+            np.column_stack([x, x_end, gaps]).ravel(),
+            np.column_stack([head1_x, x_end, head2_x, gaps]).ravel(),
+        ]
+    )
+    ys = np.concatenate(
+        [
+            np.column_stack([y, y_end, gaps]).ravel(),
+            np.column_stack([head1_y, y_end, head2_y, gaps]).ravel(),
+        ]
+    )
+    return xs, ys
+
+
+@functools.lru_cache(maxsize=16)
+def _render_placeholder_image(text: str) -> str:
+    """Render a text-only placeholder as a base64 PNG data URI.
+
+    Placeholders only depend on their text, so rendered images are cached.
+    """
+    fig, ax = plt.subplots(figsize=(6, 4))
+    try:
+        ax.text(
+            0.5,
+            0.5,
+            text,
+            ha="center",
+            va="center",
+            fontsize=16,
+            transform=ax.transAxes,
+        )
+        ax.set_xlim(0, 1)
+        ax.set_ylim(0, 1)
+        ax.axis("off")
+
+        img_buffer = io.BytesIO()
+        fig.savefig(
+            img_buffer, format="png", bbox_inches="tight", dpi=100, facecolor="white"
+        )
+    finally:
+        # Release the figure even if rendering fails
+        plt.close(fig)
+
+    img_base64 = base64.b64encode(img_buffer.getvalue()).decode("utf-8")
+    return f"data:image/png;base64,{img_base64}"
+
 
 class EelbrainPlotly2DViz:
     """Interactive 2D brain visualization for brain data using Plotly and Dash.
@@ -67,8 +254,8 @@ class EelbrainPlotly2DViz:
      arrow_threshold
          Threshold for displaying arrows in brain projections. Only arrows with
          magnitude greater than this value will be displayed. If None, all arrows
-         are shown. If 'auto', uses 10% of the maximum magnitude as threshold.
-         Default is None.
+         are shown. If 'auto', uses 10% of the maximum magnitude in the view at
+         the current time point as threshold. Default is None.
      arrow_scale
          Relative scale factor for arrow length in brain projections. The default
          value of 1.0 provides a good balance for most datasets. Use 0.5 for half
@@ -99,8 +286,17 @@ class EelbrainPlotly2DViz:
          Default is 'lyr' (GlassBrain standard) for optimal hemisphere comparison.
      show_labels
          If True, shows plot titles and legends (e.g., 'Source Activity Time Series',
-         'Source 0', 'Source 1', etc.). If False, hides all titles and legends for a
+         'Sources', 'Mean Activity', etc.). If False, hides all titles and legends for a
          cleaner visualization. Default is False.
+     is_jupyter_mode
+         If True, builds the layout with compact Jupyter styles from the start,
+         so that displaying the app in a notebook does not rebuild it. Showing
+         the app inline in Jupyter switches to these styles automatically.
+         Default is False.
+     build_app
+         If False, skips building the Dash app (layout and callbacks). Figures
+         can still be created, e.g. for export, but :meth:`run` is unavailable.
+         Default is True.
 
      Notes
      -----
@@ -128,25 +324,12 @@ class EelbrainPlotly2DViz:
         layout_mode: str = "vertical",
         display_mode: str = "lyr",
         show_labels: bool = False,
+        is_jupyter_mode: bool = False,
+        build_app: bool = True,
     ):
         """Initialize the visualization app and load data."""
-        # Use regular Dash with modern Jupyter integration
-        # Add external CSS to remove ALL default margins/padding from Dash containers
-        external_stylesheets = [
-            {
-                "href": "data:text/css;charset=utf-8,"
-                + "*{box-sizing:border-box;}"
-                + "html{margin:0!important;padding:0!important;height:auto!important;overflow:hidden;}"
-                + "body{margin:0!important;padding:0!important;height:auto!important;overflow:hidden;}"
-                + "#react-entry-point{margin:0!important;padding:0!important;height:auto!important;}"
-                + "#_dash-app-content{margin:0!important;padding:0!important;height:auto!important;}"
-                + "._dash-loading{margin:0!important;padding:0!important;}",
-                "rel": "stylesheet",
-            }
-        ]
-        self.app: dash.Dash = dash.Dash(
-            __name__, external_stylesheets=external_stylesheets
-        )
+        # Dash app, created at the end (see _build_app)
+        self.app: Optional[dash.Dash] = None
 
         # Initialize data attributes
         self.glass_brain_data: Optional[np.ndarray] = None  # (n_sources, 3, n_times)
@@ -162,12 +345,25 @@ class EelbrainPlotly2DViz:
         self.arrow_threshold: Optional[Union[float, str]] = arrow_threshold
         # Scale factor for arrow length
         self.arrow_scale: float = arrow_scale
-        self.is_jupyter_mode: bool = False  # Track if running in Jupyter mode
+        # Track if running in Jupyter mode
+        self.is_jupyter_mode: bool = is_jupyter_mode
         self.realtime_mode_default = (
             ["realtime"] if realtime else []
         )  # Default state for real-time mode
         self.show_labels: bool = show_labels  # Control titles and legends display
         self._current_layout_config: Optional[Dict[str, Any]] = None
+        # Signature of the last built layout (see _rebuild_layout)
+        self._layout_signature: Optional[tuple] = None
+        # Incremented whenever the view ranges are recomputed
+        self._view_ranges_version: int = 0
+        # Per-view projection of source_coords (see _get_projection_indices)
+        self._projection_coords: Optional[np.ndarray] = None
+        self._projection_indices: Dict[str, Dict[str, Any]] = {}
+        # Arrow visibility per view, source and time point
+        # (see _get_arrow_mask_per_time)
+        self._arrow_mask_key: Optional[tuple] = None
+        self._arrow_magnitudes: Optional[np.ndarray] = None
+        self._arrow_masks: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
 
         # Validate and set layout mode
         valid_layouts = ["vertical", "horizontal"]
@@ -188,20 +384,35 @@ class EelbrainPlotly2DViz:
         else:
             self._load_source_data(region)
 
-        # Calculate and store fixed axis ranges for each view to prevent size changes
-        self._calculate_view_ranges()
-
-        # Unify view sizes to ensure all brain plots have consistent display size
-        # This is especially important in horizontal layout mode
-        self._unify_view_sizes_for_jupyter()
+        # Calculate fixed, unified axis ranges so all brain plots keep a
+        # consistent display size (especially important in horizontal layout)
+        self._finalize_view_ranges()
 
         # Calculate global colormap range across all time points for consistent visualization
         self._calculate_global_colormap_range()
 
         # Setup app
+        if build_app:
+            self._build_app()
+        else:
+            # Figures still follow the layout configuration
+            self._current_layout_config = self._get_layout_config()
+
+    def _build_app(self) -> None:
+        """Create the Dash app with its layout and callbacks."""
+        # Use regular Dash with modern Jupyter integration
+        self.app = dash.Dash(__name__, external_stylesheets=_EXTERNAL_STYLESHEETS)
         self._setup_layout()
         self._setup_callbacks()
 
+    def _require_app(self) -> None:
+        """Raise an error if the instance was created without a Dash app."""
+        if self.app is None:
+            raise RuntimeError(
+                "This visualization was created with build_app=False and has no "
+                "Dash app to run; create it with build_app=True"
+            )
+
     def _load_source_data(self, region: Optional[str] = None) -> None:
         """Load MNE sample data and prepare for 2D brain visualization.
 
@@ -242,7 +453,7 @@ class EelbrainPlotly2DViz:
             self.parcellation: Optional[Any] = None
 
         # Compute norm for butterfly plot
-        self.butterfly_data = np.linalg.norm(self.glass_brain_data, axis=1)
+        self.butterfly_data = _vector_norm(self.glass_brain_data)
 
     def _load_ndvar_data(self, y: NDVar) -> None:
         """Load data from NDVar directly.
@@ -276,7 +487,7 @@ class EelbrainPlotly2DViz:
                 ("source", "space", "time")
             )  # (n_sources, 3, n_times)
             # Compute norm for butterfly plot
-            self.butterfly_data = np.linalg.norm(self.glass_brain_data, axis=1)
+            self.butterfly_data = _vector_norm(self.glass_brain_data)
         else:
             # Scalar data - no space dimension
             self.glass_brain_data = y.get_data(
@@ -340,17 +551,28 @@ class EelbrainPlotly2DViz:
         else:
             raise ValueError(f"Unsupported display_mode: {mode}")
 
-    def _calculate_view_ranges(self) -> None:
-        """Calculate fixed axis ranges for each brain view to prevent size changes.
+    def _finalize_view_ranges(self) -> None:
+        """Calculate fixed, unified axis ranges for each brain view.
+
+        Ranges are computed from the coordinate projection of each view with 5%
+        padding, then centered on that view and widened to the largest extent
+        across all views. This keeps plot sizes constant over time points and
+        makes all views appear uniform in size (horizontal layout, Jupyter).
 
-        This ensures that brain plots maintain consistent size across all time points.
+        Ranges are stored as an array of shape (n_views, 2, 2) holding the
+        ``[[x_min, x_max], [y_min, y_max]]`` of each view, indexed through
+        ``_view_idx``, and mirrored in the ``view_ranges`` dict.
         """
+        self._view_ranges_version += 1
+        self.view_ranges = {}
+        self._view_idx: Dict[str, int] = {}
+        self._view_range_array = np.empty((0, 2, 2))
         if self.source_coords is None:
-            self.view_ranges = {}
             return
 
         coords = self.source_coords
-        self.view_ranges = {}
+        centers = {}
+        max_width = 0.0
 
         for view_name in self.brain_views:
             # Get the appropriate coordinate projections for each view
@@ -378,7 +600,6 @@ class EelbrainPlotly2DViz:
                 x_coords = coords[:, 0]
                 y_coords = coords[:, 1]
 
-            # Calculate ranges with some padding
             x_min, x_max = x_coords.min(), x_coords.max()
             y_min, y_max = y_coords.min(), y_coords.max()
 
@@ -388,53 +609,20 @@ class EelbrainPlotly2DViz:
             x_padding = x_range * 0.05 if x_range > 0 else 0.01
             y_padding = y_range * 0.05 if y_range > 0 else 0.01
 
-            self.view_ranges[view_name] = {
-                "x": [x_min - x_padding, x_max + x_padding],
-                "y": [y_min - y_padding, y_max + y_padding],
-            }
-
-    def _unify_view_sizes_for_jupyter(self) -> None:
-        """Unify view sizes for Jupyter mode to ensure consistent display.
-
-        This method adjusts all brain view ranges to have the same width and height,
-        making them appear uniform in size when displayed in Jupyter notebooks.
-        Only called when using show_in_jupyter().
-        """
-        if not self.view_ranges:
-            return
+            centers[view_name] = ((x_min + x_max) / 2, (y_min + y_max) / 2)
+            # Use the larger of the two to ensure square-ish plots with equal sizing
+            max_width = max(max_width, x_range + 2 * x_padding, y_range + 2 * y_padding)
 
-        # Calculate the maximum width and height across all views
-        max_x_width = max(
-            ranges["x"][1] - ranges["x"][0] for ranges in self.view_ranges.values()
-        )
-        max_y_width = max(
-            ranges["y"][1] - ranges["y"][0] for ranges in self.view_ranges.values()
+        # Set every range centered on its view with the unified maximum width
+        self._view_idx = {view_name: i for i, view_name in enumerate(centers)}
+        half_width = np.array([-max_width / 2, max_width / 2])
+        self._view_range_array = (
+            np.array(list(centers.values())).reshape(-1, 2, 1) + half_width
         )
-
-        # Use the larger of the two to ensure square-ish plots with equal sizing
-        max_width = max(max_x_width, max_y_width)
-
-        # Update all views to use the unified maximum range
-        for view_name in self.view_ranges:
-            # Get current center
-            x_center = (
-                self.view_ranges[view_name]["x"][0]
-                + self.view_ranges[view_name]["x"][1]
-            ) / 2
-            y_center = (
-                self.view_ranges[view_name]["y"][0]
-                + self.view_ranges[view_name]["y"][1]
-            ) / 2
-
-            # Set new range centered around the same point with max width
-            self.view_ranges[view_name]["x"] = [
-                x_center - max_width / 2,
-                x_center + max_width / 2,
-            ]
-            self.view_ranges[view_name]["y"] = [
-                y_center - max_width / 2,
-                y_center + max_width / 2,
-            ]
+        for view_name, (x_range, y_range) in zip(
+            centers, self._view_range_array.tolist()
+        ):
+            self.view_ranges[view_name] = {"x": x_range, "y": y_range}
 
     def _calculate_global_colormap_range(self) -> None:
         """Calculate global min/max activity across all time points for fixed colormap.
@@ -448,8 +636,8 @@ class EelbrainPlotly2DViz:
             # Calculate activity magnitude across all time points
             if self.glass_brain_data.ndim == 3:  # Vector data (n_sources, 3, n_times)
                 # Compute norm for each source at each time point
-                all_magnitudes = np.linalg.norm(
-                    self.glass_brain_data, axis=1
+                all_magnitudes = _vector_norm(
+                    self.glass_brain_data
                 )  # (n_sources, n_times)
             else:  # Scalar data (n_sources, n_times)
                 all_magnitudes = self.glass_brain_data
@@ -700,11 +888,27 @@ class EelbrainPlotly2DViz:
 
         return containers
 
+    def _get_layout_signature(self) -> tuple:
+        """Return a small signature of the state the app layout depends on."""
+        return (
+            self.layout_mode,
+            self.is_jupyter_mode,
+            self.display_mode,
+            self._view_ranges_version,
+        )
+
+    def _rebuild_layout(self) -> None:
+        """Rebuild the Dash app layout unless it is already up to date."""
+        if self._get_layout_signature() == self._layout_signature:
+            return
+        self._setup_layout()
+
     def _setup_layout(self) -> None:
         """Setup the Dash app layout based on layout_mode."""
         # Get layout configuration first
         config = self._get_layout_config()
         self._current_layout_config = config
+        self._layout_signature = self._get_layout_signature()
 
         # Extract butterfly height from config
         butterfly_height = None
@@ -1011,7 +1215,6 @@ class EelbrainPlotly2DViz:
                 brain_plots = self._create_2d_brain_projections_plotly(
                     time_idx, source_idx
                 )
-                return tuple(brain_plots[view_name] for view_name in self.brain_views)
             except Exception:
                 # Return empty plots on error
                 empty_fig = go.Figure()
@@ -1023,7 +1226,12 @@ class EelbrainPlotly2DViz:
                     y=0.5,
                     showarrow=False,
                 )
-                return tuple(empty_fig for _ in self.brain_views)
+                brain_plots = {view_name: empty_fig for view_name in self.brain_views}
+
+            return tuple(
+                self._patch_brain_figure(brain_plots[view_name])
+                for view_name in self.brain_views
+            )
 
         @self.app.callback(
             Output("selected-time-idx", "data"),
@@ -1125,6 +1333,24 @@ class EelbrainPlotly2DViz:
             )
             return result
 
+    @staticmethod
+    def _patch_brain_figure(fig: go.Figure) -> Patch:
+        """Return the update to send to the browser for one brain view.
+
+        The browser already holds a brain figure from the initial layout, and
+        only the traces and a few layout fields change between time points. The
+        patch replaces those, so the static layout is not sent again and no
+        per-client state is needed on the server.
+        """
+        patch = Patch()
+        patch["data"] = list(fig.data)
+        patch["layout"]["title"] = fig.layout.title
+        patch["layout"]["annotations"] = list(fig.layout.annotations)
+        patch["layout"]["xaxis"]["range"] = fig.layout.xaxis.range
+        patch["layout"]["yaxis"]["range"] = fig.layout.yaxis.range
+        patch["layout"]["height"] = fig.layout.height
+        return patch
+
     def _create_butterfly_plot(
         self, selected_time_idx: int = 0, figure_height: Optional[int] = None
     ) -> go.Figure:
@@ -1152,8 +1378,8 @@ class EelbrainPlotly2DViz:
 
         n_sources, n_times = self.butterfly_data.shape
 
-        # Auto-scale data for visibility
-        data_to_plot = self.butterfly_data.copy()
+        # Auto-scale data for visibility (scaling below creates a new array)
+        data_to_plot = self.butterfly_data
         scale_factor = 1.0
         unit_suffix = ""
 
@@ -1181,30 +1407,36 @@ class EelbrainPlotly2DViz:
             step = max(1, n_sources // max_traces)
             indices_to_plot = list(range(0, n_sources, step))
 
-            # Add individual traces
-            for idx, i in enumerate(indices_to_plot[:10]):
+            # Concatenate the individual traces into a single trace with NaN gaps
+            # between sources; one trace renders much faster than many small ones
+            segments_x, segments_y, segments_source = [], [], []
+            for i in indices_to_plot[:10]:
                 trace_data = data_to_plot[i, :]
+                keep = _lttb_indices(self.time_values, trace_data, BUTTERFLY_MAX_POINTS)
+                segments_x.extend([self.time_values[keep], [np.nan]])
+                segments_y.extend([trace_data[keep], [np.nan]])
+                segments_source.extend([np.full(len(keep), i), [np.nan]])
 
-                fig.add_trace(
-                    go.Scatter(
-                        x=self.time_values,
-                        y=trace_data,
-                        mode="lines",
-                        name=f"Source {i}",
-                        customdata=[i] * n_times,
-                        showlegend=(idx < 3) and self.show_labels,
-                        opacity=0.6,
-                        line=dict(width=1),
-                        hoverinfo="skip",  # Don't show in hover
-                    )
+            fig.add_trace(
+                go.Scattergl(
+                    x=np.concatenate(segments_x),
+                    y=np.concatenate(segments_y),
+                    mode="lines",
+                    name="Sources",
+                    customdata=np.concatenate(segments_source),
+                    showlegend=self.show_labels,
+                    line=dict(color="rgba(100, 100, 100, 0.6)", width=1),
+                    hoverinfo="skip",  # Don't show in hover
                 )
+            )
 
         # Add mean trace (always shown)
         mean_activity = np.mean(data_to_plot, axis=0)
+        keep = _lttb_indices(self.time_values, mean_activity, BUTTERFLY_MAX_POINTS)
         fig.add_trace(
             go.Scatter(
-                x=self.time_values,
-                y=mean_activity,
+                x=self.time_values[keep],
+                y=mean_activity[keep],
                 mode="lines",
                 name="Mean Activity",
                 line=dict(color="red", width=3),
@@ -1215,10 +1447,11 @@ class EelbrainPlotly2DViz:
 
         # Add max trace (always shown)
         max_activity = np.max(data_to_plot, axis=0)
+        keep = _lttb_indices(self.time_values, max_activity, BUTTERFLY_MAX_POINTS)
         fig.add_trace(
             go.Scatter(
-                x=self.time_values,
-                y=max_activity,
+                x=self.time_values[keep],
+                y=max_activity[keep],
                 mode="lines",
                 name="Max Activity",
                 line=dict(color="darkblue", width=3),
@@ -1332,9 +1565,7 @@ class EelbrainPlotly2DViz:
             # Get activity at this time point
             if self.glass_brain_data.ndim == 3:  # (n_sources, 3, n_times)
                 time_activity = self.glass_brain_data[:, :, time_idx]  # (n_sources, 3)
-                activity_magnitude = np.linalg.norm(
-                    time_activity, axis=1
-                )  # (n_sources,)
+                activity_magnitude = _vector_norm(time_activity)  # (n_sources,)
             else:  # (n_sources, n_times)
                 activity_magnitude = self.glass_brain_data[:, time_idx]
 
@@ -1409,6 +1640,164 @@ class EelbrainPlotly2DViz:
                 "coronal": placeholder_fig,
             }
 
+    def _get_projection_indices(
+        self, view_name: str, coords: np.ndarray
+    ) -> Dict[str, Any]:
+        """Return the time-independent 2D projection of a brain view.
+
+        Results are cached per view and recomputed when ``coords`` is replaced.
+        """
+        if self._projection_coords is not coords:
+            self._projection_coords = coords
+            self._projection_indices = {}
+        if view_name not in self._projection_indices:
+            self._projection_indices[view_name] = self._precompute_projection_indices(
+                view_name, coords
+            )
+        return self._projection_indices[view_name]
+
+    def _get_arrow_mask_per_time(
+        self, view_name: str, indices: np.ndarray
+    ) -> Optional[np.ndarray]:
+        """Return which sources of a view show an arrow at each time point.
+
+        With ``arrow_threshold='auto'``, the threshold is 10% of the maximum
+        magnitude among the view's sources at each time point. The mask only
+        depends on the data, ``arrow_threshold`` and the view's sources, so it
+        is computed once per view and reused until any of them changes.
+
+        Parameters
+        ----------
+        view_name
+            Name of the brain view.
+        indices
+            Source indices shown in the view (see _get_projection_indices).
+
+        Returns
+        -------
+        mask
+            Boolean array of shape (len(indices), n_times), or None if all
+            arrows are shown.
+        """
+        if self.arrow_threshold is None or self.glass_brain_data is None:
+            return None
+
+        key = self._arrow_mask_key
+        if (
+            key is None
+            or key[0] is not self.glass_brain_data
+            or key[1] != self.arrow_threshold
+        ):
+            self._arrow_magnitudes = _vector_norm(self.glass_brain_data)
+            self._arrow_masks = {}
+            self._arrow_mask_key = (self.glass_brain_data, self.arrow_threshold)
+
+        cached = self._arrow_masks.get(view_name)
+        if cached is None or cached[0] is not indices:
+            magnitudes = self._arrow_magnitudes[indices]
+            if self.arrow_threshold == "auto":
+                # Use 10% of the view's maximum magnitude at each time point
+                threshold_value = 0.1 * magnitudes.max(axis=0)
+            else:
+                threshold_value = float(self.arrow_threshold)
+            cached = (indices, magnitudes > threshold_value)
+            self._arrow_masks[view_name] = cached
+        return cached[1]
+
+    @staticmethod
+    def _precompute_projection_indices(
+        view_name: str, coords: np.ndarray
+    ) -> Dict[str, Any]:
+        """Project source coordinates for a view and assign them to grid cells.
+
+        Parameters
+        ----------
+        view_name
+            Name of the brain view.
+        coords
+            Source coordinates, shape (n_sources, 3).
+
+        Returns
+        -------
+        projection
+            Source indices shown in the view, their 2D positions, the vector
+            components to draw, the heatmap grid (one cell per unique coordinate
+            value) with each source's cell, and position groups for arrows.
+        """
+        indices = np.arange(len(coords))
+        title = None
+        u_sign = 1
+
+        if view_name == "axial":  # Z view (X vs Y)
+            x_axis, y_axis = 0, 1
+        elif view_name == "sagittal":  # X view (Y vs Z)
+            x_axis, y_axis = 1, 2
+        elif view_name == "coronal":  # Y view (X vs Z)
+            x_axis, y_axis = 0, 2
+        elif view_name in ("left_hemisphere", "right_hemisphere"):
+            # Lateral views (Y vs Z): filter for one hemisphere, including
+            # midline voxels with X=0
+            x_axis, y_axis = 1, 2
+            if view_name == "left_hemisphere":
+                hemisphere_mask = coords[:, 0] <= 0
+                # For left hemisphere, flip Y to match neuroimaging convention
+                u_sign = -1
+            else:
+                hemisphere_mask = coords[:, 0] >= 0
+            if np.any(hemisphere_mask):
+                indices = indices[hemisphere_mask]
+        else:
+            # Fallback for unknown view types
+            x_axis, y_axis = 0, 1
+            title = f"Unknown View: {view_name}"
+
+        x_coords = u_sign * coords[indices, x_axis]
+        y_coords = coords[indices, y_axis]
+        projection = {
+            "indices": indices,
+            "x": x_coords,
+            "y": y_coords,
+            "u_axis": x_axis,
+            "v_axis": y_axis,
+            "u_sign": u_sign,
+            "title": title,
+        }
+        if len(indices) == 0:
+            return projection
+
+        # Create data-driven grid using unique coordinate values
+        unique_x, x_bins = np.unique(x_coords, return_inverse=True)
+        unique_y, y_bins = np.unique(y_coords, return_inverse=True)
+
+        # Grid boundaries: small intervals around each unique coordinate point
+        x_spacing = np.diff(unique_x).min() / 2 if len(unique_x) > 1 else 0.001
+        y_spacing = np.diff(unique_y).min() / 2 if len(unique_y) > 1 else 0.001
+        x_edges = np.concatenate([[unique_x[0] - x_spacing], unique_x + x_spacing])
+        y_edges = np.concatenate([[unique_y[0] - y_spacing], unique_y + y_spacing])
+
+        # Flat cell index of each source in a (n_y, n_x) grid, with sources
+        # sorted by cell so per-cell maxima reduce over contiguous runs
+        cell_index = y_bins.ravel() * len(unique_x) + x_bins.ravel()
+        cell_order = np.argsort(cell_index, kind="stable")
+        cells, cell_starts = np.unique(cell_index[cell_order], return_index=True)
+
+        # Sources sharing a 2D position (rounded to avoid floating point
+        # precision issues) are drawn as a single arrow
+        positions = np.column_stack([np.round(x_coords, 6), np.round(y_coords, 6)])
+        _, position_groups = np.unique(positions, axis=0, return_inverse=True)
+
+        projection.update(
+            x_centers=(x_edges[:-1] + x_edges[1:]) / 2,
+            y_centers=(y_edges[:-1] + y_edges[1:]) / 2,
+            grid_shape=(len(unique_y), len(unique_x)),
+            grid_size=len(unique_y) * len(unique_x),
+            cell_order=cell_order,
+            cell_starts=cell_starts,
+            cells=cells,
+            position_groups=position_groups.ravel(),
+        )
+        return projection
+
     def _create_plotly_brain_projection(
         self,
         view_name: str,
@@ -1428,13 +1817,17 @@ class EelbrainPlotly2DViz:
         figure_height
             Optional figure height in pixels. If None, uses default based on mode.
         """
-        # Show all data without filtering
-        active_coords = coords
-        active_activity = activity
-        active_indices = np.arange(len(coords))
-
-        # Create Plotly figure
+        # Time-independent projection of this view (cached per coords array)
+        projection = self._get_projection_indices(view_name, coords)
+        active_indices = projection["indices"]
+        active_activity = activity[active_indices]
+        x_coords = projection["x"]
+        y_coords = projection["y"]
+        title = projection["title"]
+
+        # Create Plotly figure; traces are collected and added in one batch
         fig = go.Figure()
+        traces = []
 
         # Get time index for vector components
         time_idx = np.argmin(np.abs(self.time_values - time_value))
@@ -1448,123 +1841,31 @@ class EelbrainPlotly2DViz:
 
         # Check if we have vector data (3D) or scalar data (1D)
         has_vector_data = active_vectors is not None and active_vectors.shape[1] == 3
-
-        # Project to 2D based on view
-        if view_name == "axial":  # Z view (X vs Y)
-            x_coords = active_coords[:, 0]
-            y_coords = active_coords[:, 1]
-            if has_vector_data:
-                u_vectors = active_vectors[:, 0]  # X components
-                v_vectors = active_vectors[:, 1]  # Y components
-            title = None
-        elif view_name == "sagittal":  # X view (Y vs Z)
-            x_coords = active_coords[:, 1]
-            y_coords = active_coords[:, 2]
-            if has_vector_data:
-                u_vectors = active_vectors[:, 1]  # Y components
-                v_vectors = active_vectors[:, 2]  # Z components
-            title = None
-        elif view_name == "coronal":  # Y view (X vs Z)
-            x_coords = active_coords[:, 0]
-            y_coords = active_coords[:, 2]
-            if has_vector_data:
-                u_vectors = active_vectors[:, 0]  # X components
-                v_vectors = active_vectors[:, 2]  # Z components
-            title = None
-        elif (
-            view_name == "left_hemisphere"
-        ):  # Left hemisphere lateral view (Y vs Z, X <= 0)
-            # Filter for left hemisphere (include midline voxels with X=0)
-            left_mask = active_coords[:, 0] <= 0
-            if np.any(left_mask):
-                active_coords = active_coords[left_mask]
-                active_activity = active_activity[left_mask]
-                active_indices = active_indices[left_mask]
-                if has_vector_data:
-                    active_vectors = active_vectors[left_mask]
-
-            # For left hemisphere, flip Y coordinates to match neuroimaging convention
-            x_coords = -active_coords[:, 1]  # Negative Y coordinates (flipped)
-            y_coords = active_coords[:, 2]  # Z coordinates
-            if has_vector_data:
-                u_vectors = -active_vectors[:, 1]  # Negative Y components (flipped)
-                v_vectors = active_vectors[:, 2]  # Z components
-            title = None
-        elif (
-            view_name == "right_hemisphere"
-        ):  # Right hemisphere lateral view (Y vs Z, X >= 0)
-            # Filter for right hemisphere (include midline voxels with X=0)
-            right_mask = active_coords[:, 0] >= 0
-            if np.any(right_mask):
-                active_coords = active_coords[right_mask]
-                active_activity = active_activity[right_mask]
-                active_indices = active_indices[right_mask]
-                if has_vector_data:
-                    active_vectors = active_vectors[right_mask]
-
-            x_coords = active_coords[:, 1]  # Y coordinates
-            y_coords = active_coords[:, 2]  # Z coordinates
-            if has_vector_data:
-                u_vectors = active_vectors[:, 1]  # Y components
-                v_vectors = active_vectors[:, 2]  # Z components
-            title = None
-        else:
-            # Fallback for unknown view types
-            x_coords = active_coords[:, 0]
-            y_coords = active_coords[:, 1]
-            if has_vector_data:
-                u_vectors = active_vectors[:, 0]
-                v_vectors = active_vectors[:, 1]
-            title = f"Unknown View: {view_name}"
-
-        if len(active_coords) > 0:
-            # Create data-driven grid using unique coordinate values
-            unique_x = np.unique(x_coords)
-            unique_y = np.unique(y_coords)
-
-            # Create grid boundaries around each unique coordinate point
-            x_spacing = np.diff(unique_x).min() / 2 if len(unique_x) > 1 else 0.001
-            y_spacing = np.diff(unique_y).min() / 2 if len(unique_y) > 1 else 0.001
-
-            # Create grid boundaries: small intervals around each data point
-            x_edges = []
-            for i, x_val in enumerate(unique_x):
-                if i == 0:
-                    x_edges.append(x_val - x_spacing)
-                x_edges.append(x_val + x_spacing)
-
-            y_edges = []
-            for i, y_val in enumerate(unique_y):
-                if i == 0:
-                    y_edges.append(y_val - y_spacing)
-                y_edges.append(y_val + y_spacing)
-
-            x_edges = np.array(x_edges)
-            y_edges = np.array(y_edges)
-
-            # Use binned_statistic_2d to get maximum value per bin
-            H_max, x_edges_used, y_edges_used, _ = binned_statistic_2d(
-                x_coords,
-                y_coords,
-                active_activity,
-                statistic="max",  # Take maximum value in each bin
-                bins=[x_edges, y_edges],
+        if has_vector_data:
+            u_vectors = projection["u_sign"] * active_vectors[:, projection["u_axis"]]
+            v_vectors = active_vectors[:, projection["v_axis"]]
+
+        if len(active_indices) > 0:
+            # Maximum activity per grid cell; cells without sources stay NaN,
+            # which the heatmap shows as transparent. Sources are pre-sorted by
+            # cell so this is a single reduction over contiguous runs.
+            H_flat = np.full(projection["grid_size"], np.nan)
+            H_flat[projection["cells"]] = np.maximum.reduceat(
+                active_activity[projection["cell_order"]], projection["cell_starts"]
             )
-
-            # Use grid center points for display
-            x_centers = (x_edges_used[:-1] + x_edges_used[1:]) / 2
-            y_centers = (y_edges_used[:-1] + y_edges_used[1:]) / 2
-
-            # Set NaN values to NaN to make them transparent in heatmap
-            # binned_statistic_2d returns NaN for empty bins
-            H_display = H_max.copy()  # Use maximum value per bin
+            # Rows are y, columns are x (Plotly orientation); float32 halves the
+            # payload sent to the browser on every update.
+            H_display = H_flat.reshape(projection["grid_shape"]).astype(np.float32)
+            x_centers = projection["x_centers"]
+            y_centers = projection["y_centers"]
 
             # Add heatmap trace
-            fig.add_trace(
+            traces.append(
                 go.Heatmap(
                     x=x_centers,
                     y=y_centers,
-                    z=H_display.T,  # Transpose to match Plotly orientation
+                    z=H_display,
+                    zsmooth=False,  # Crisp voxels, no interpolation pass
                     colorscale=self.cmap,
                     colorbar=(
                         dict(
@@ -1594,70 +1895,46 @@ class EelbrainPlotly2DViz:
                 # Base scale of 0.025 provides good default visualization
                 arrow_scale = self.arrow_scale * 0.025
 
-                # Calculate arrow magnitudes for filtering
-                arrow_magnitudes = np.linalg.norm(active_vectors, axis=1)
-
-                # Determine threshold for showing arrows
-                if self.arrow_threshold is None:
+                # Arrows meeting the threshold at this time point
+                arrow_mask = self._get_arrow_mask_per_time(view_name, active_indices)
+                if arrow_mask is None:
                     # Show all arrows
-                    show_arrow_mask = np.ones(len(active_vectors), dtype=bool)
-                elif self.arrow_threshold == "auto":
-                    # Use 10% of maximum magnitude as threshold
-                    threshold_value = 0.1 * np.max(arrow_magnitudes)
-                    show_arrow_mask = arrow_magnitudes > threshold_value
+                    candidates = np.arange(len(active_indices))
                 else:
-                    # Use specified threshold
-                    threshold_value = float(self.arrow_threshold)
-                    show_arrow_mask = arrow_magnitudes > threshold_value
-
-                # Group sources by 2D position and select the one with maximum ACTIVITY
-                # (not 2D projected magnitude) for each position.
-                # Multiple 3D sources can project to the same 2D position, so we need
-                # to select one. We choose the source with highest activity because
-                # that's what we display in the hover and heatmap.
-                position_to_max_idx = {}
-
-                # Check all source points
-                for i in range(len(active_coords)):
-                    # Only consider arrows that meet the threshold criteria
-                    if not show_arrow_mask[i]:
-                        continue
-
-                    # Create position key (rounded to avoid floating point precision
-                    # issues)
-                    pos_key = (round(x_coords[i], 6), round(y_coords[i], 6))
-
-                    # If this position hasn't been seen, or current source has larger
-                    # ACTIVITY (3D magnitude), select it.
-                    # This ensures the displayed arrow shows the maximum activity value
-                    # for that 2D position, matching the heatmap and hover display.
-                    if (
-                        pos_key not in position_to_max_idx
-                        or active_activity[i]
-                        > active_activity[position_to_max_idx[pos_key]]
-                    ):
-                        position_to_max_idx[pos_key] = i
-
-                # OPTIMIZED BATCH ARROW RENDERING
-                if position_to_max_idx:
-                    # Extract arrow data for selected sources
-                    selected_indices = list(position_to_max_idx.values())
-                    arrow_x = x_coords[selected_indices]
-                    arrow_y = y_coords[selected_indices]
-                    arrow_u = u_vectors[selected_indices]
-                    arrow_v = v_vectors[selected_indices]
-                    # Get the actual activity (3D magnitude) for hover display
-                    arrow_activities = active_activity[selected_indices]
-
-                    # Create all arrows using Plotly quiver plot (fastest method)
-                    self._create_quiver_arrows(
-                        fig,
-                        arrow_x,
-                        arrow_y,
-                        arrow_u,
-                        arrow_v,
-                        arrow_scale,
-                        activity_values=arrow_activities,
+                    candidates = np.flatnonzero(arrow_mask[:, time_idx])
+
+                # Near-baseline time points often have no arrow above threshold;
+                # skip all arrow work for them
+                if len(candidates) > 0:
+                    # Group sources by 2D position and select the one with maximum
+                    # ACTIVITY (not 2D projected magnitude) for each position.
+                    # Multiple 3D sources can project to the same 2D position, so
+                    # we need to select one. We choose the source with highest
+                    # activity because that's what we display in the hover and
+                    # heatmap.
+                    groups = projection["position_groups"][candidates]
+                    # Sort by position, then descending activity; the stable sort
+                    # keeps the first source when activities tie
+                    order = np.lexsort((-active_activity[candidates], groups))
+                    sorted_groups = groups[order]
+                    is_first = np.ones(len(order), dtype=bool)
+                    is_first[1:] = sorted_groups[1:] != sorted_groups[:-1]
+                    # Keep positions in the order they are first encountered
+                    _, first_seen = np.unique(groups, return_index=True)
+                    selected_indices = candidates[order[is_first]][
+                        np.argsort(first_seen)
+                    ]
+
+                    # OPTIMIZED BATCH ARROW RENDERING
+                    # Create all arrows as a single quiver trace (fastest method)
+                    traces.append(
+                        self._create_quiver_arrows(
+                            x_coords[selected_indices],
+                            y_coords[selected_indices],
+                            u_vectors[selected_indices],
+                            v_vectors[selected_indices],
+                            arrow_scale,
+                        )
                     )
 
             # Highlight selected source if provided
@@ -1665,7 +1942,7 @@ class EelbrainPlotly2DViz:
                 selected_pos = np.where(active_indices == selected_source)[0]
                 if len(selected_pos) > 0:
                     pos = selected_pos[0]
-                    fig.add_trace(
+                    traces.append(
                         go.Scatter(
                             x=[x_coords[pos]],
                             y=[y_coords[pos]],
@@ -1685,35 +1962,29 @@ class EelbrainPlotly2DViz:
                     # Highlight selected source arrow if vectors available
                     if has_vector_data:
                         # Check if the selected source arrow meets the threshold
-                        selected_arrow_magnitude = np.linalg.norm(active_vectors[pos])
-                        show_selected_arrow = True
-
-                        if self.arrow_threshold is not None:
-                            if self.arrow_threshold == "auto":
-                                threshold_value = 0.1 * np.max(
-                                    np.linalg.norm(active_vectors, axis=1)
-                                )
-                            else:
-                                threshold_value = float(self.arrow_threshold)
-                            show_selected_arrow = (
-                                selected_arrow_magnitude > threshold_value
-                            )
+                        arrow_mask = self._get_arrow_mask_per_time(
+                            view_name, active_indices
+                        )
+                        show_selected_arrow = (
+                            arrow_mask is None or arrow_mask[pos, time_idx]
+                        )
 
                         if show_selected_arrow:
                             x_start = x_coords[pos]
                             y_start = y_coords[pos]
 
                             # Add highlighted arrow for selected source (using quiver)
-                            self._create_quiver_arrows(
-                                fig,
-                                np.array([x_start]),
-                                np.array([y_start]),
-                                np.array([u_vectors[pos]]),
-                                np.array([v_vectors[pos]]),
-                                arrow_scale,
-                                color="cyan",
-                                width=2,
-                                size=1.0,
+                            traces.append(
+                                self._create_quiver_arrows(
+                                    np.array([x_start]),
+                                    np.array([y_start]),
+                                    np.array([u_vectors[pos]]),
+                                    np.array([v_vectors[pos]]),
+                                    arrow_scale,
+                                    color="cyan",
+                                    width=2,
+                                    size=1.0,
+                                )
                             )
         else:
             # Add annotation if no active sources
@@ -1726,6 +1997,8 @@ class EelbrainPlotly2DViz:
                 showarrow=False,
             )
 
+        fig.add_traces(traces)
+
         # Update layout based on mode
         # Use consistent right margin for all plots to ensure uniform size
         if figure_height is not None:
@@ -1745,9 +2018,11 @@ class EelbrainPlotly2DViz:
         # to ensure uniform brain plot sizes. Colorbar is positioned outside at x=1.15
 
         # Get fixed axis ranges for this view to prevent size changes across time
-        axis_ranges = self.view_ranges.get(view_name, {})
-        x_range = axis_ranges.get("x", None)
-        y_range = axis_ranges.get("y", None)
+        view_idx = self._view_idx.get(view_name)
+        if view_idx is None:
+            x_range = y_range = None
+        else:
+            x_range, y_range = self._view_range_array[view_idx].tolist()
 
         fig.update_layout(
             title=title,
@@ -1775,6 +2050,10 @@ class EelbrainPlotly2DViz:
             autosize=True,  # Enable autosize to fill container
             margin=margin,
             showlegend=False,
+            # Only pick the point under the cursor (the heatmap cell), not
+            # nearby arrows
+            hovermode="closest",
+            hoverdistance=1,
             # plot_bgcolor="#2b2b2b",  # Dark background for brain plots
             hoverlabel=dict(
                 bgcolor="rgba(255, 255, 255, 0.7)",  # Semi-transparent white background
@@ -1787,7 +2066,6 @@ class EelbrainPlotly2DViz:
 
     def _create_quiver_arrows(
         self,
-        fig: go.Figure,
         x_coords: np.ndarray,
         y_coords: np.ndarray,
         u_vectors: np.ndarray,
@@ -1796,178 +2074,42 @@ class EelbrainPlotly2DViz:
         color: str = "black",
         width: int = 1,
         size: float = 0.8,
-        activity_values: Optional[np.ndarray] = None,
-    ) -> None:
-        """Create arrows using Plotly's figure_factory quiver plot.
+    ) -> Dict[str, Any]:
+        """Create arrows as a single line trace of NaN-separated segments.
 
-        This method uses ff.create_quiver which provides proper arrow visualization
-        with built-in Plotly optimizations.
+        Arrow shafts and heads are computed with NumPy by
+        :func:`_build_quiver_segments` (same geometry as ``ff.create_quiver``)
+        and returned as one ``Scattergl`` trace dict, so callers can add all
+        traces of a figure in one batch.
 
         Note: Arrow head size scales with arrow length (Plotly default behavior).
-
-        Parameters
-        ----------
-        activity_values
-            Optional array of activity values (3D magnitude) to display in hover.
-            If None, uses 2D projected magnitude.
-        """
-        if len(x_coords) == 0:
-            return
-
-        try:
-            # Create quiver figure using Plotly's figure_factory
-            quiver_fig = ff.create_quiver(
-                x=x_coords,
-                y=y_coords,
-                u=u_vectors,
-                v=v_vectors,
-                scale=arrow_scale,  # Scale controls arrow length
-                arrow_scale=size * 0.3,  # Arrow head size (relative to arrow length)
-                line=dict(color=color, width=width),
-                name="vectors",
-            )
-
-            # Add all traces from quiver figure to our figure
-            for trace in quiver_fig.data:
-                # Customize the trace
-                trace.showlegend = False
-                # Disable hover on arrows to show only heatmap hover
-                trace.hoverinfo = "skip"
-
-                fig.add_trace(trace)
-
-        except Exception as e:
-            print(f"Warning: Quiver plot failed ({e}), falling back to annotations")
-            # Fall back to annotation method if quiver fails
-            self._create_batch_arrows(
-                fig,
-                x_coords,
-                y_coords,
-                u_vectors,
-                v_vectors,
-                arrow_scale,
-                color,
-                width,
-                size,
-                activity_values,
-            )
-
-    def _create_batch_arrows(
-        self,
-        fig: go.Figure,
-        x_coords: np.ndarray,
-        y_coords: np.ndarray,
-        u_vectors: np.ndarray,
-        v_vectors: np.ndarray,
-        arrow_scale: float,
-        color: str = "black",
-        width: int = 1,
-        size: float = 0.8,
-        activity_values: Optional[np.ndarray] = None,
-    ) -> None:
-        """Create arrows using annotation-based method (fallback for quiver).
-
-        This is a simple, single-threaded implementation used as fallback
-        when quiver plots fail. The bottleneck is in rendering (adding to figure),
-        not in computation, so multi-threading doesn't help much.
-
-        Parameters
-        ----------
-        activity_values
-            Optional array of activity values (3D magnitude) to display in hover.
-            If None, uses 2D projected magnitude.
         """
+        x_segments, y_segments = _build_quiver_segments(
+            x_coords,
+            y_coords,
+            u_vectors,
+            v_vectors,
+            arrow_scale,
+            head_size=size * 0.3,  # Arrow head size (relative to arrow length)
+        )
 
-        if len(x_coords) == 0:
-            return
-
-        # Calculate all endpoints at once (vectorized)
-        x_ends = x_coords + u_vectors * arrow_scale
-        y_ends = y_coords + v_vectors * arrow_scale
-
-        # Note: activity_values parameter exists for API compatibility but is not used
-        # because annotations don't display hovertext (to avoid interfering with heatmap hover)
-
-        # Create annotation objects using simple list comprehension
-        # Note: No hovertext to avoid interfering with heatmap hover
-        annotations_to_add = [
-            dict(
-                x=float(x_ends[i]),
-                y=float(y_ends[i]),
-                ax=float(x_coords[i]),
-                ay=float(y_coords[i]),
-                xref="x",
-                yref="y",
-                axref="x",
-                ayref="y",
-                text="",
-                showarrow=True,
-                arrowhead=2,
-                arrowsize=size,
-                arrowwidth=width,
-                arrowcolor=color,
-                # No hovertext - show only heatmap hover
-            )
-            for i in range(len(x_coords))
-        ]
-
-        # Batch add all annotations at once
-        if annotations_to_add:
-            # Get existing annotations (if any) and add new ones
-            existing_annotations = (
-                list(fig.layout.annotations) if fig.layout.annotations else []
-            )
-            all_annotations = existing_annotations + annotations_to_add
-
-            # Update layout with all annotations in one operation
-            fig.update_layout(annotations=all_annotations)
-
-    def _fig_to_base64(self, fig: plt.Figure) -> str:
-        """Convert matplotlib figure to base64 string for Dash display."""
-        try:
-            # Save figure to bytes buffer
-            img_buffer = io.BytesIO()
-            fig.savefig(
-                img_buffer,
-                format="png",
-                bbox_inches="tight",
-                dpi=100,
-                facecolor="white",
-            )
-            img_buffer.seek(0)
-
-            # Convert to base64 string
-            img_base64 = base64.b64encode(img_buffer.read()).decode("utf-8")
-            img_buffer.close()
-
-            return f"data:image/png;base64,{img_base64}"
-
-        except Exception:
-            return self._create_placeholder_image("Conversion Error")
+        return dict(
+            type="scattergl",
+            x=x_segments,
+            y=y_segments,
+            mode="lines",
+            line=dict(color=color, width=width),
+            name="vectors",
+            showlegend=False,
+            # Disable hover on arrows to show only heatmap hover; skipped traces
+            # are left out of plotly.js hover picking entirely
+            hoverinfo="skip",
+            hovertemplate="",
+        )
 
     def _create_placeholder_image(self, text: str = "No Data") -> str:
         """Create a placeholder image when brain plotting fails."""
-
-        # Create a simple matplotlib figure
-        fig, ax = plt.subplots(figsize=(6, 4))
-        ax.text(
-            0.5,
-            0.5,
-            text,
-            ha="center",
-            va="center",
-            fontsize=16,
-            transform=ax.transAxes,
-        )
-        ax.set_xlim(0, 1)
-        ax.set_ylim(0, 1)
-        ax.axis("off")
-
-        # Convert to base64
-        img_base64 = self._fig_to_base64(fig)
-        plt.close(fig)
-
-        return img_base64
+        return _render_placeholder_image(text)
 
     def run(
         self,
@@ -1989,7 +2131,13 @@ class EelbrainPlotly2DViz:
             - 'jupyterlab': Open in JupyterLab tab (modern Dash)
             - 'external': Open in separate browser window (default outside Jupyter)
             If None, automatically selects 'inline' in Jupyter, 'external' otherwise.
+
+        Raises
+        ------
+        RuntimeError
+            If the visualization was created with ``build_app=False``.
         """
+        self._require_app()
         if port is None:
             port = random.randint(8001, 9001)
 
@@ -2001,11 +2149,8 @@ class EelbrainPlotly2DViz:
             # Set Jupyter mode and rebuild layout with Jupyter-specific styles
             self.is_jupyter_mode = True
 
-            # Unify view sizes for Jupyter mode to ensure consistent display
-            self._unify_view_sizes_for_jupyter()
-
             # Rebuild layout with Jupyter styles
-            self._setup_layout()
+            self._rebuild_layout()
 
             # Auto-calculate height
             iframe_height = self._estimate_jupyter_iframe_height()
@@ -2046,6 +2191,7 @@ class EelbrainPlotly2DViz:
         >>> viz = EelbrainPlotly2DViz()
         >>> viz._show_in_jupyter()
         """
+        self._require_app()
         if not JUPYTER_AVAILABLE:
             print("Warning: Jupyter environment not detected.")
             print("Falling back to external browser mode...")
@@ -2054,11 +2200,7 @@ class EelbrainPlotly2DViz:
 
         # Set Jupyter mode and rebuild layout with Jupyter-specific styles
         self.is_jupyter_mode = True
-
-        # Unify view sizes for Jupyter mode to ensure consistent display
-        self._unify_view_sizes_for_jupyter()
-
-        self._setup_layout()  # Rebuild layout with Jupyter styles
+        self._rebuild_layout()  # Rebuild layout with Jupyter styles
 
         self.run(mode="inline", debug=debug)
 
@@ -0,0 +1,119 @@
+"""
+Shared fixtures for eelbrain_plotly_viz tests.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cached_mne_sample():
+    """Load each MNE sample dataset only once per test session.
+
+    Every ``EelbrainPlotly2DViz()`` without data loads the MNE sample dataset,
+    which dominates test run time. Loaded datasets are memoized and each call
+    receives a shallow copy, since the visualization replaces entries (e.g.
+    when applying a parcellation).
+    """
+    from eelbrain import datasets
+
+    get_mne_sample = datasets.get_mne_sample
+    cache = {}
+
+    def cached_get_mne_sample(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        if key not in cache:
+            cache[key] = get_mne_sample(*args, **kwargs)
+        return cache[key].copy()
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(datasets, "get_mne_sample", cached_get_mne_sample)
+        yield
+    # Release the loaded datasets before session teardown finishes
+    cache.clear()
+
+
+@pytest.fixture(
+    scope="session",
+    params=[(50, 20, True, 42), (30, 15, False, 123)],
+    ids=["vec", "scalar"],
+)
+def sample_data(request):
+    """Sample brain data, built once per session for vector and scalar data."""
+    from eelbrain_plotly_viz.sample_data import create_sample_brain_data
+
+    n_sources, n_times, has_vector_data, random_seed = request.param
+    return create_sample_brain_data(
+        n_sources=n_sources,
+        n_times=n_times,
+        has_vector_data=has_vector_data,
+        random_seed=random_seed,
+    )
+
+
+@pytest.fixture(scope="session")
+def default_viz():
+    """A default ``EelbrainPlotly2DViz`` shared by tests that only read from it."""
+    from eelbrain_plotly_viz import EelbrainPlotly2DViz
+
+    return EelbrainPlotly2DViz()
+
+
+@pytest.fixture
+def viz():
+    """A fresh ``EelbrainPlotly2DViz`` without Dash app for tests that modify it.
+
+    The sample dataset is cached for the session, so construction is cheap.
+    """
+    from eelbrain_plotly_viz import EelbrainPlotly2DViz
+
+    return EelbrainPlotly2DViz(build_app=False)
+
+
+@pytest.fixture(scope="session")
+def large_brain_data():
+    """A 500-source, 100-time-point scalar dataset in visualization layout.
+
+    Keys match the ``EelbrainPlotly2DViz`` attributes they replace. Tests
+    must not modify the arrays in place.
+    """
+    import numpy as np
+    from eelbrain_plotly_viz.sample_data import create_sample_brain_data
+
+    data_dict = create_sample_brain_data(
+        n_sources=500, n_times=100, has_vector_data=False, random_seed=42
+    )
+    data = data_dict["data"]  # (sources, time)
+    return {
+        "glass_brain_data": data[:, np.newaxis, :],  # (sources, 1, time)
+        "source_coords": data_dict["coords"],
+        "time_values": data_dict["times"],
+        "butterfly_data": data,
+    }
+
+
+@pytest.fixture(scope="session")
+def perf_limit():
+    """Time limit in seconds for performance tests.
+
+    Slow CI runners can raise it with the ``PERF_LIMIT_SEC`` environment
+    variable.
+    """
+    import os
+
+    return float(os.environ.get("PERF_LIMIT_SEC", 30))
+
+
+@pytest.fixture(scope="session")
+def pyproject():
+    """The repository's ``pyproject.toml``, parsed once per session."""
+    import sys
+    from pathlib import Path
+
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        tomllib = pytest.importorskip("tomli")
+
+    path = Path(__file__).resolve().parent.parent / "pyproject.toml"
+    with open(path, "rb") as f:
+        return tomllib.load(f)
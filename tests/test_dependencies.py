@@ -0,0 +1,22 @@
+"""
+Tests that the package's runtime dependencies are importable.
+"""
+
+import importlib
+
+import pytest
+
+REQUIRED_DEPENDENCIES = ["dash", "plotly", "numpy", "matplotlib"]
+OPTIONAL_DEPENDENCIES = ["eelbrain", "orjson"]
+
+
+@pytest.mark.parametrize("dependency", REQUIRED_DEPENDENCIES)
+def test_required_dependency(dependency):
+    """Test that a required dependency is available."""
+    importlib.import_module(dependency)
+
+
+@pytest.mark.parametrize("dependency", OPTIONAL_DEPENDENCIES)
+def test_optional_dependency(dependency):
+    """Test that an optional dependency imports when it is installed."""
+    pytest.importorskip(dependency)
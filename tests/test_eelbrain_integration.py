@@ -0,0 +1,41 @@
+"""
+Integration tests with eelbrain NDVar data.
+"""
+
+import pytest
+
+eelbrain = pytest.importorskip("eelbrain")
+
+
+@pytest.fixture(scope="session")
+def sample_vol():
+    """MNE sample volume source estimate with vector orientation."""
+    return eelbrain.datasets.get_mne_sample(src="vol", ori="vector")
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"cmap": "Viridis", "show_max_only": True}],
+    ids=["defaults", "options"],
+)
+def test_ndvar_visualization(sample_vol, options):
+    """Test creating a visualization from an eelbrain NDVar."""
+    from eelbrain_plotly_viz import EelbrainPlotly2DViz
+
+    viz = EelbrainPlotly2DViz(y=sample_vol["src"], **options)
+
+    assert viz.glass_brain_data is not None
+    assert viz.source_coords is not None
+    assert viz.time_values is not None
+    for name, value in options.items():
+        assert getattr(viz, name) == value
+
+
+def test_parcellation():
+    """Test loading the sample data with a parcellation."""
+    from eelbrain_plotly_viz import EelbrainPlotly2DViz
+
+    viz = EelbrainPlotly2DViz(region="aparc+aseg", build_app=False)
+
+    assert viz.glass_brain_data is not None
+    assert viz.region_of_brain in ("aparc+aseg", "Full Brain")
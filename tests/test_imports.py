@@ -5,20 +5,20 @@ This test module specifically catches import issues that could arise from
 filename case mismatches or missing dependencies.
 """
 
+import importlib
+import importlib.util
+import os
+
 import pytest
 
+PUBLIC_NAMES = ("EelbrainPlotly2DViz", "BrainPlotly2DViz", "create_sample_brain_data")
 
-def test_all_imports_together():
-    """Test that all imports can be done in a single statement."""
-    from eelbrain_plotly_viz import (
-        EelbrainPlotly2DViz,
-        BrainPlotly2DViz,
-        create_sample_brain_data,
-    )
 
-    assert EelbrainPlotly2DViz is not None
-    assert BrainPlotly2DViz is not None
-    assert create_sample_brain_data is not None
+@pytest.mark.parametrize("name", PUBLIC_NAMES)
+def test_public_import(name):
+    """Test that each public name can be imported from the package."""
+    package = importlib.import_module("eelbrain_plotly_viz")
+    assert getattr(package, name) is not None
 
 
 def test_direct_module_imports():
@@ -51,37 +51,14 @@ def test_package_all_attribute():
     import eelbrain_plotly_viz
 
     assert hasattr(eelbrain_plotly_viz, "__all__")
-    expected_items = {
-        "EelbrainPlotly2DViz",
-        "BrainPlotly2DViz",
-        "create_sample_brain_data",
-    }
-    assert set(eelbrain_plotly_viz.__all__) == expected_items
-
-
-def test_no_import_errors():
-    """Test that importing the package doesn't raise any exceptions."""
-    import eelbrain_plotly_viz
-
-    # Test basic instantiation to catch runtime import issues
-    viz = eelbrain_plotly_viz.EelbrainPlotly2DViz()
-    assert viz is not None
+    assert set(eelbrain_plotly_viz.__all__) == set(PUBLIC_NAMES)
 
 
 def test_case_sensitive_filename_compliance():
-    """Test that the imports work correctly (indicating proper filename conventions)."""
-    # Instead of checking file paths (which vary between dev and installed packages),
-    # we test that the imports work, which indicates the files are named correctly
-
-    # This import will only work if the file is named correctly (viz_2d.py)
-    from eelbrain_plotly_viz import EelbrainPlotly2DViz
-
-    # Test that we can create an instance (ensures the import chain works)
-    viz = EelbrainPlotly2DViz()
-    assert viz is not None
-
-    # Test that the module follows the expected pattern
-    import eelbrain_plotly_viz
-
-    module_file = eelbrain_plotly_viz.__file__
-    assert "eelbrain_plotly_viz" in module_file
+    """Test that the modules are found under their expected filenames."""
+    # Instead of hard-coding file paths (which vary between dev and installed
+    # packages), locate the modules through the import system
+    package_file = importlib.util.find_spec("eelbrain_plotly_viz").origin
+    assert "eelbrain_plotly_viz" in package_file
+    module_file = importlib.util.find_spec("eelbrain_plotly_viz.viz_2d").origin
+    assert os.path.basename(module_file) == "viz_2d.py"
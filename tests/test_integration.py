@@ -2,19 +2,29 @@
 Integration tests for eelbrain_plotly_viz package.
 """
 
+import hashlib
+import importlib.util
+import os
 import pytest
 import tempfile
-from eelbrain_plotly_viz import EelbrainPlotly2DViz
+from unittest.mock import patch
 
+requires_kaleido = pytest.mark.skipif(
+    importlib.util.find_spec("kaleido") is None,
+    reason="kaleido required for image export testing",
+)
 
+
+@requires_kaleido
 def test_export_functionality():
     """Test image export functionality."""
-    # Check for required dependencies upfront
-    pytest.importorskip("kaleido", reason="kaleido required for image export testing")
+    from eelbrain_plotly_viz import EelbrainPlotly2DViz
 
     viz = EelbrainPlotly2DViz()
 
-    with tempfile.TemporaryDirectory() as temp_dir:
+    # CI points PYTEST_TMP_BACKING at a tmpfs so exported images stay in memory
+    backing_dir = os.environ.get("PYTEST_TMP_BACKING")
+    with tempfile.TemporaryDirectory(dir=backing_dir) as temp_dir:
         # Test export functionality
         result = viz.export_images(output_dir=temp_dir, time_idx=5, format="png")
 
@@ -25,21 +35,48 @@ def test_export_functionality():
 
 def test_jupyter_mode():
     """Test Jupyter mode functionality."""
+    from eelbrain_plotly_viz import EelbrainPlotly2DViz
+
     viz = EelbrainPlotly2DViz()
+    browser_config = viz._get_layout_config()
 
-    # Test setting Jupyter mode
+    # Switching to Jupyter mode selects a more compact layout configuration
     viz.is_jupyter_mode = True
-    viz._setup_layout()  # Rebuild layout with Jupyter styles
+    jupyter_config = viz._get_layout_config()
+    assert jupyter_config["plot_height"] != browser_config["plot_height"]
+
+    # The layout is rebuilt once for the new mode, then left alone
+    with patch.object(
+        EelbrainPlotly2DViz,
+        "_setup_layout",
+        autospec=True,
+        side_effect=EelbrainPlotly2DViz._setup_layout,
+    ) as mock:
+        viz._rebuild_layout()
+        viz._rebuild_layout()
+    assert mock.call_count == 1
+    assert viz._current_layout_config == jupyter_config
+
 
-    # Should still have a valid layout
-    assert hasattr(viz.app, "layout")
-    assert viz.is_jupyter_mode is True
+def test_layout_signature():
+    """Test that the initial layout is current until the view ranges change."""
+    from eelbrain_plotly_viz import EelbrainPlotly2DViz
+
+    viz = EelbrainPlotly2DViz(is_jupyter_mode=True)
+    # The initial layout already matches the requested mode
+    assert viz._layout_signature == viz._get_layout_signature()
+
+    # Recomputing the view ranges invalidates it
+    viz._finalize_view_ranges()
+    assert viz._layout_signature != viz._get_layout_signature()
 
 
 def test_multiple_visualizations():
     """Test creating multiple visualizations doesn't interfere."""
-    viz1 = EelbrainPlotly2DViz(cmap="Hot", show_max_only=False)
-    viz2 = EelbrainPlotly2DViz(cmap="Viridis", show_max_only=True)
+    from eelbrain_plotly_viz import EelbrainPlotly2DViz
+
+    viz1 = EelbrainPlotly2DViz(cmap="Hot", show_max_only=False, build_app=False)
+    viz2 = EelbrainPlotly2DViz(cmap="Viridis", show_max_only=True, build_app=False)
 
     # Each should maintain its own settings
     assert viz1.cmap == "Hot"
@@ -52,35 +89,33 @@ def test_multiple_visualizations():
     fig2 = viz2._create_butterfly_plot()
 
     assert fig1 is not fig2
-    assert hasattr(fig1, "data")
-    assert hasattr(fig2, "data")
+    # Each figure follows its own show_max_only setting
+    assert "Sources" in [trace.name for trace in fig1.data]
+    assert "Sources" not in [trace.name for trace in fig2.data]
 
 
-def test_error_handling():
+def test_error_handling(default_viz, viz):
     """Test error handling in various scenarios."""
-    viz = EelbrainPlotly2DViz()
-
     # Test with invalid time index
-    brain_plots = viz._create_2d_brain_projections_plotly(time_idx=999999)
+    brain_plots = default_viz._create_2d_brain_projections_plotly(time_idx=999999)
 
     # Should still return a valid dictionary (with error handling)
     assert isinstance(brain_plots, dict)
     assert len(brain_plots) == 3
 
     # Test with None data (edge case)
-    viz_empty = EelbrainPlotly2DViz()
-    viz_empty.glass_brain_data = None
-    viz_empty.source_coords = None
-    viz_empty.time_values = None
+    viz.glass_brain_data = None
+    viz.source_coords = None
+    viz.time_values = None
 
     # Should handle gracefully
-    brain_plots_empty = viz_empty._create_2d_brain_projections_plotly()
+    brain_plots_empty = viz._create_2d_brain_projections_plotly()
     assert isinstance(brain_plots_empty, dict)
 
 
-def test_callback_functionality():
+def test_callback_functionality(default_viz):
     """Test that Dash callbacks are properly set up."""
-    viz = EelbrainPlotly2DViz()
+    viz = default_viz
 
     # Check that the app has callbacks registered
     assert hasattr(viz.app, "callback_map")
@@ -90,9 +125,9 @@ def test_callback_functionality():
     assert viz.app.layout is not None
 
 
-def test_data_consistency():
+def test_data_consistency(default_viz):
     """Test data consistency across different methods."""
-    viz = EelbrainPlotly2DViz()
+    viz = default_viz
 
     # All data arrays should have consistent shapes
     n_sources, n_space, n_times = viz.glass_brain_data.shape
@@ -102,6 +137,14 @@ def test_data_consistency():
     assert viz.butterfly_data.shape[1] == n_times
     assert len(viz.time_values) == n_times
 
+    # Plotting must not modify the data in place
+    def digest(array):
+        return hashlib.blake2b(array.tobytes()).digest()
+
+    butterfly_digest = digest(viz.butterfly_data)
+    viz._create_butterfly_plot()
+    assert digest(viz.butterfly_data) == butterfly_digest
+
     # Test that projections use consistent data
     brain_plots = viz._create_2d_brain_projections_plotly(time_idx=5)
 
@@ -109,3 +152,90 @@ def test_data_consistency():
         assert hasattr(fig, "data")
         # Should have at least a heatmap trace
         assert len(fig.data) > 0
+
+
+def test_brain_figure_patch():
+    """Test that brain updates send the traces and changing layout fields."""
+    import plotly.graph_objects as go
+    from dash import Patch
+    from eelbrain_plotly_viz import EelbrainPlotly2DViz
+
+    viz = EelbrainPlotly2DViz(build_app=False)
+    view_name = viz.brain_views[0]
+    fig = viz._create_2d_brain_projections_plotly(time_idx=1)[view_name]
+    patch = viz._patch_brain_figure(fig)
+    assert isinstance(patch, Patch)
+
+    # Applying the patch to the initial figure reproduces the new figure
+    initial = viz._create_2d_brain_projections_plotly(time_idx=0)[view_name]
+    updated = initial.to_dict()
+    for operation in patch.to_plotly_json()["operations"]:
+        *path, key = operation["location"]
+        target = updated
+        for name in path:
+            target = target.setdefault(name, {})
+        target[key] = operation["params"]["value"]
+    assert go.Figure(updated).to_json() == go.Figure(fig.to_dict()).to_json()
+
+
+def test_without_app(default_viz):
+    """Test that figures can be created without building the Dash app."""
+    from eelbrain_plotly_viz import EelbrainPlotly2DViz
+
+    viz = EelbrainPlotly2DViz(build_app=False)
+    assert viz.app is None
+
+    # Figures match those of a visualization with an app
+    brain_plots = viz._create_2d_brain_projections_plotly(time_idx=5, source_idx=3)
+    expected = default_viz._create_2d_brain_projections_plotly(time_idx=5, source_idx=3)
+    assert brain_plots.keys() == expected.keys()
+    for view_name, fig in brain_plots.items():
+        assert fig.to_json() == expected[view_name].to_json()
+    assert viz._create_butterfly_plot(5).to_json() == (
+        default_viz._create_butterfly_plot(5).to_json()
+    )
+
+    # Without an app there is nothing to serve
+    with pytest.raises(RuntimeError):
+        viz.run()
+    with pytest.raises(RuntimeError):
+        viz._show_in_jupyter()
+
+
+def test_projection_cache(viz):
+    """Test that cached view projections follow replaced source coordinates."""
+    import numpy as np
+
+    view_name = viz.brain_views[0]
+    projection = viz._get_projection_indices(view_name, viz.source_coords)
+    assert viz._get_projection_indices(view_name, viz.source_coords) is projection
+
+    # Every source shown in the view maps to exactly one grid cell
+    n_y, n_x = projection["grid_shape"]
+    assert len(projection["x_centers"]) == n_x
+    assert len(projection["y_centers"]) == n_y
+    assert projection["cell_starts"][-1] < len(projection["indices"])
+
+    viz.source_coords = viz.source_coords + np.array([0.01, 0.0, 0.0])
+    shifted = viz._get_projection_indices(view_name, viz.source_coords)
+    assert shifted is not projection
+
+
+def test_arrow_mask(viz):
+    """Test that the 'auto' arrow threshold is 10% of each view's frame maximum."""
+    import numpy as np
+
+    viz.arrow_threshold = "auto"
+    view_name = "left_hemisphere"
+    indices = viz._get_projection_indices(view_name, viz.source_coords)["indices"]
+    mask = viz._get_arrow_mask_per_time(view_name, indices)
+    magnitudes = np.linalg.norm(viz.glass_brain_data[indices], axis=1)
+    assert mask.shape == magnitudes.shape
+    for time_idx in range(magnitudes.shape[1]):
+        frame = magnitudes[:, time_idx]
+        assert np.array_equal(mask[:, time_idx], frame > 0.1 * np.max(frame))
+    assert viz._get_arrow_mask_per_time(view_name, indices) is mask
+
+    # Changing the threshold recomputes the mask
+    viz.arrow_threshold = None
+    assert viz._get_arrow_mask_per_time(view_name, indices) is None
@@ -0,0 +1,24 @@
+"""
+Tests for the packaging configuration in pyproject.toml.
+"""
+
+import pytest
+
+
+@pytest.mark.parametrize("field", ["requires", "build-backend"])
+def test_build_system(pyproject, field):
+    """Test that the build system is configured."""
+    assert field in pyproject.get("build-system", {})
+
+
+@pytest.mark.parametrize("field", ["name", "version", "description", "dependencies"])
+def test_project_metadata(pyproject, field):
+    """Test that the required project metadata is present."""
+    assert field in pyproject.get("project", {})
+
+
+def test_version_matches_package(pyproject):
+    """Test that the project version matches the package version."""
+    import eelbrain_plotly_viz
+
+    assert pyproject["project"]["version"] == eelbrain_plotly_viz.__version__
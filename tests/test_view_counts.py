@@ -0,0 +1,93 @@
+"""
+Tests for the number of brain views per display and layout mode.
+"""
+
+import pytest
+
+from eelbrain_plotly_viz import EelbrainPlotly2DViz
+
+TEST_VIEW_CASES = [
+    # 1-view coverage (vertical + horizontal)
+    ("x", "vertical", ["sagittal"]),
+    ("y", "vertical", ["coronal"]),
+    ("l", "vertical", ["left_hemisphere"]),
+    ("z", "horizontal", ["axial"]),
+    ("r", "horizontal", ["right_hemisphere"]),
+    # 2-view coverage (vertical + horizontal)
+    ("yz", "vertical", ["coronal", "axial"]),
+    ("xz", "horizontal", ["sagittal", "axial"]),
+    ("yx", "horizontal", ["coronal", "sagittal"]),
+    ("lr", "horizontal", ["left_hemisphere", "right_hemisphere"]),
+    # 3-view coverage (vertical + horizontal)
+    ("lyr", "vertical", ["left_hemisphere", "coronal", "right_hemisphere"]),
+    ("ortho", "vertical", ["sagittal", "coronal", "axial"]),
+    ("ortho", "horizontal", ["sagittal", "coronal", "axial"]),
+    # 4-view coverage (vertical + horizontal)
+    ("lzry", "vertical", ["left_hemisphere", "axial", "right_hemisphere", "coronal"]),
+    ("lyrz", "vertical", ["left_hemisphere", "coronal", "right_hemisphere", "axial"]),
+    ("lzry", "horizontal", ["left_hemisphere", "axial", "right_hemisphere", "coronal"]),
+]
+
+# (layout_mode, number of views) combinations covered by TEST_VIEW_CASES
+_VIEW_COVERAGE = frozenset((layout, len(views)) for _, layout, views in TEST_VIEW_CASES)
+
+
+@pytest.mark.parametrize(
+    "display_mode,layout_mode,expected_views",
+    TEST_VIEW_CASES,
+)
+def test_brain_view_counts(display_mode, layout_mode, expected_views):
+    """Each display/layout combo should expose the correct brain view count."""
+    viz = EelbrainPlotly2DViz(
+        display_mode=display_mode, layout_mode=layout_mode, build_app=False
+    )
+
+    assert viz.brain_views == expected_views
+
+    layout_config = viz._get_layout_config()
+    assert layout_config["num_views"] == len(expected_views)
+    assert layout_config["brain_views"] == expected_views
+
+    brain_plots = viz._create_2d_brain_projections_plotly(time_idx=0)
+    assert set(brain_plots.keys()) == set(expected_views)
+    assert len(brain_plots) == len(expected_views)
+
+    for fig in brain_plots.values():
+        assert hasattr(fig, "data")
+        assert hasattr(fig, "layout")
+
+
+@pytest.mark.parametrize(
+    "display_mode,layout_mode,expected_views",
+    # One case for each number of views
+    [TEST_VIEW_CASES[i] for i in (0, 5, 11, 12)],
+)
+def test_brain_update_callback(display_mode, layout_mode, expected_views):
+    """The brain update callback should output exactly the current brain views."""
+    viz = EelbrainPlotly2DViz(display_mode=display_mode, layout_mode=layout_mode)
+
+    brain_callbacks = []
+    for callback in viz.app.callback_map.values():
+        outputs = callback["output"]
+        if not isinstance(outputs, list):
+            outputs = [outputs]
+        if any(output.component_id.startswith("brain-") for output in outputs):
+            brain_callbacks.append(outputs)
+
+    assert len(brain_callbacks) == 1
+    assert [
+        (output.component_id, output.component_property)
+        for output in brain_callbacks[0]
+    ] == [(f"brain-{view_name}-plot", "figure") for view_name in expected_views]
+
+
+def test_layout_view_count_coverage():
+    """Ensure we cover 1–4 brain views for both vertical and horizontal layouts."""
+    for layout in ("vertical", "horizontal"):
+        for count in (1, 2, 3, 4):
+            assert (
+                layout,
+                count,
+            ) in _VIEW_COVERAGE, (
+                f"Missing coverage for {layout} layout with {count} view(s)"
+            )
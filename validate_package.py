@@ -3,346 +3,205 @@
 Package validation script for LiveNeuron.
 
 This script tests that the package is properly structured and functional
-according to Python packaging standards.
+according to Python packaging standards. Run it directly, or collect it with
+pytest (``pytest validate_package.py``).
 """
 
+import functools
 import sys
-import importlib
-import subprocess
-import os
+import importlib.util
+from pathlib import Path
+
+# Package root, so that the checks do not depend on the working directory
+ROOT = Path(__file__).parent
 
 # Add src directory to Python path to use local source code
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+sys.path.insert(0, str(ROOT / 'src'))
+
+# Test modules from the test suite that are part of the validation
+SUITE_MODULES = [
+    ROOT / "tests" / "test_dependencies.py",
+    ROOT / "tests" / "test_packaging.py",
+    ROOT / "tests" / "test_eelbrain_integration.py",
+]
+
+EXAMPLES = [
+    "example_1_sample_data",
+    "example_2_region_filtering",
+    "example_3_eelbrain_data",
+    "example_4_custom_colormap",
+    "example_8_different_options",
+]
+
+
+try:
+    # Under pytest, share the test suite's session-wide MNE sample memoizer
+    from tests.conftest import cached_mne_sample  # noqa: F401
+except ImportError:  # pytest is not installed
+    pass
 
 
 def test_package_structure():
     """Test that package has proper structure."""
-    print("📁 Testing package structure...")
-    
     required_files = [
         "pyproject.toml",
-        "README.md", 
+        "README.md",
         "LICENSE",
         "src/eelbrain_plotly_viz/__init__.py",
-        "src/eelbrain_plotly_viz/viz_2D.py",  # Updated to match actual filename
+        "src/eelbrain_plotly_viz/viz_2d.py",
         "src/eelbrain_plotly_viz/sample_data.py",
         "tests/test_basic.py",
         "example.py"
     ]
-    
-    missing_files = []
-    for file_path in required_files:
-        if not os.path.exists(file_path):
-            missing_files.append(file_path)
-    
-    if missing_files:
-        print(f"❌ Missing required files: {missing_files}")
-        return False
-    else:
-        print("✅ All required files present")
-        return True
+
+    missing_files = [path for path in required_files if not (ROOT / path).exists()]
+    assert not missing_files, f"Missing required files: {missing_files}"
 
 
 def test_package_imports():
     """Test that package imports work correctly."""
-    print("\n📦 Testing package imports...")
-    
-    try:
-        # Test main package import
-        import eelbrain_plotly_viz
-        print("✅ Main package imports successfully")
-        
-        # Test specific imports (using alias for compatibility)
-        from eelbrain_plotly_viz import BrainPlotly2DViz, EelbrainPlotly2DViz, create_sample_brain_data
-        print("✅ Core classes import successfully")
-        
-        # Test that alias works
-        assert BrainPlotly2DViz is EelbrainPlotly2DViz
-        print("✅ Class alias works correctly")
-        
-        # Test package metadata
-        if hasattr(eelbrain_plotly_viz, '__version__'):
-            print(f"✅ Package version: {eelbrain_plotly_viz.__version__}")
-        
-        return True
-        
-    except ImportError as e:
-        print(f"❌ Import error: {e}")
-        return False
+    # Test main package import
+    import eelbrain_plotly_viz
 
+    # Test specific imports (using alias for compatibility)
+    from eelbrain_plotly_viz import BrainPlotly2DViz, EelbrainPlotly2DViz, create_sample_brain_data
 
-def test_basic_functionality():
-    """Test basic package functionality."""
-    print("\n🧠 Testing basic functionality...")
-    
-    try:
-        from eelbrain_plotly_viz import EelbrainPlotly2DViz, create_sample_brain_data
-        import numpy as np
-        
-        # Test sample data creation
-        data_dict = create_sample_brain_data(n_sources=20, n_times=10)
-        print("✅ Sample data creation works")
-        
-        # Test visualization creation with built-in sample data
-        viz1 = EelbrainPlotly2DViz()
-        print("✅ Visualization with built-in data works")
-        
-        # Test different parameter combinations
-        viz2 = EelbrainPlotly2DViz(
-            y=None,
-            region=None,
-            cmap='Viridis',
-            show_max_only=True,
-            arrow_threshold='auto'
-        )
-        print("✅ Visualization with custom parameters works")
-        
-        # Test custom colormap
-        custom_cmap = [[0, 'blue'], [1, 'red']]
-        viz3 = EelbrainPlotly2DViz(cmap=custom_cmap)
-        print("✅ Visualization with custom colormap works")
-        
-        # Test brain projection creation
-        projections = viz1.create_2d_brain_projections_plotly(time_idx=0)
-        assert 'axial' in projections
-        assert 'sagittal' in projections
-        assert 'coronal' in projections
-        print("✅ Brain projections creation works")
-        
-        # Test butterfly plot creation
-        butterfly = viz1.create_butterfly_plot()
-        assert hasattr(butterfly, 'data')
-        print("✅ Butterfly plot creation works")
-        
-        # Test different arrow thresholds
-        viz4 = EelbrainPlotly2DViz(arrow_threshold=None)
-        viz5 = EelbrainPlotly2DViz(arrow_threshold=0.5)
-        print("✅ Different arrow threshold options work")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Functionality error: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    # Test that alias works
+    assert BrainPlotly2DViz is EelbrainPlotly2DViz
 
+    # Test package metadata
+    assert hasattr(eelbrain_plotly_viz, '__version__')
 
-def test_dependencies():
-    """Test that required dependencies are available."""
-    print("\n📚 Testing dependencies...")
-    
-    required_deps = [
-        'dash',
-        'plotly', 
-        'numpy',
-        'matplotlib',
-        'scipy'
-    ]
-    
-    missing_deps = []
-    for dep in required_deps:
-        try:
-            importlib.import_module(dep)
-            print(f"✅ {dep} available")
-        except ImportError:
-            missing_deps.append(dep)
-            print(f"❌ {dep} missing")
-    
-    # Test optional dependencies
-    optional_deps = ['eelbrain']
-    for dep in optional_deps:
-        try:
-            importlib.import_module(dep)
-            print(f"✅ {dep} available (optional)")
-        except ImportError:
-            print(f"ℹ️  {dep} not available (optional)")
-    
-    return len(missing_deps) == 0
+
+def test_basic_functionality():
+    """Test basic package functionality."""
+    from eelbrain_plotly_viz import EelbrainPlotly2DViz, create_sample_brain_data
+
+    # Test sample data creation
+    data_dict = create_sample_brain_data(n_sources=20, n_times=10)
+    assert data_dict["data"].shape == (20, 10, 3)
+
+    # Test visualization creation with built-in sample data
+    viz1 = EelbrainPlotly2DViz()
+
+    # Test different parameter combinations
+    viz2 = EelbrainPlotly2DViz(
+        y=None,
+        region=None,
+        cmap='Viridis',
+        show_max_only=True,
+        arrow_threshold='auto'
+    )
+    assert viz2.cmap == 'Viridis'
+
+    # Test custom colormap
+    custom_cmap = [[0, 'blue'], [1, 'red']]
+    viz3 = EelbrainPlotly2DViz(cmap=custom_cmap)
+    assert viz3.cmap == custom_cmap
+
+    # Test brain projection creation (default 'lyr' display mode)
+    projections = viz1._create_2d_brain_projections_plotly(time_idx=0)
+    assert 'left_hemisphere' in projections
+    assert 'coronal' in projections
+    assert 'right_hemisphere' in projections
+
+    # Test butterfly plot creation
+    butterfly = viz1._create_butterfly_plot()
+    assert hasattr(butterfly, 'data')
+
+    # Test different arrow thresholds (viz1 already uses the default None)
+    assert viz1.arrow_threshold is None
+    viz5 = EelbrainPlotly2DViz(arrow_threshold=0.5)
+    assert viz5.arrow_threshold == 0.5
 
 
 def test_build_system():
     """Test that the package can be built."""
-    print("\n🔨 Testing build system...")
-    
-    try:
-        # Check if build tool is available
-        subprocess.run([sys.executable, '-m', 'build', '--help'], 
-                      capture_output=True, check=True)
-        print("✅ Build tool available")
-        
-        # Test that pyproject.toml is valid
-        try:
-            import tomli
-            with open('pyproject.toml', 'rb') as f:
-                config = tomli.load(f)
-        except ImportError:
-            # Fallback for Python 3.11+
-            import tomllib
-            with open('pyproject.toml', 'rb') as f:
-                config = tomllib.load(f)
-        
-        # Check required build-system fields
-        if 'build-system' in config:
-            build_system = config['build-system']
-            if 'requires' in build_system and 'build-backend' in build_system:
-                print("✅ pyproject.toml build system properly configured")
-            else:
-                print("❌ pyproject.toml missing build system configuration")
-                return False
-        else:
-            print("❌ pyproject.toml missing [build-system] section")
-            return False
-        
-        # Check project metadata
-        if 'project' in config:
-            project = config['project']
-            required_fields = ['name', 'version', 'description', 'dependencies']
-            missing_fields = [f for f in required_fields if f not in project]
-            if missing_fields:
-                print(f"❌ pyproject.toml missing project fields: {missing_fields}")
-                return False
-            else:
-                print("✅ pyproject.toml project metadata complete")
-        
-        return True
-        
-    except subprocess.CalledProcessError:
-        print("❌ Build tool not available")
-        return False
-    except ImportError:
-        print("ℹ️  tomli/tomllib not available for config validation")
-        return True  # Not critical for basic functionality
-    except Exception as e:
-        print(f"❌ Build system error: {e}")
-        return False
+    # Check if build tool is available (without starting an interpreter);
+    # pyproject.toml itself is checked by tests/test_packaging.py
+    assert importlib.util.find_spec('build') is not None, "Build tool not available"
 
 
-def test_example_script():
-    """Test that the example script runs without errors."""
-    print("\n📋 Testing example script...")
-    
-    try:
-        # Import example script
-        import example
-        print("✅ Example script imports successfully")
-        
-        # Test individual example functions with updated names
-        viz1 = example.example_1_sample_data()
-        print("✅ Example 1 (sample data) works")
-        
-        viz2 = example.example_2_region_filtering()
-        print("✅ Example 2 (region filtering) works")
-        
-        viz3 = example.example_3_eelbrain_data()
-        print("✅ Example 3 (eelbrain data) works")
-        
-        viz4 = example.example_4_custom_colormap()
-        print("✅ Example 4 (custom colormap) works")
-        
-        viz8 = example.example_8_different_options()
-        print("✅ Example 8 (different options) works")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Example script error: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+def pytest_generate_tests(metafunc):
+    """Run each example as a separate (slow) test."""
+    import pytest
 
+    if "name" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "name",
+            [pytest.param(name, id=name, marks=pytest.mark.slow) for name in EXAMPLES],
+        )
 
-def test_eelbrain_integration():
-    """Test eelbrain integration if available."""
-    print("\n🧠 Testing eelbrain integration...")
-    
-    try:
-        from eelbrain import datasets
-        from eelbrain_plotly_viz import EelbrainPlotly2DViz
-        
-        # Load eelbrain data
-        data_ds = datasets.get_mne_sample(src='vol', ori='vector')
-        y = data_ds['src']
-        
-        # Create visualization with eelbrain data
-        viz = EelbrainPlotly2DViz(y=y)
-        print("✅ Eelbrain NDVar integration works")
-        
-        # Test parcellation
-        viz_parc = EelbrainPlotly2DViz(y=None, region='aparc+aseg')
-        print("✅ Eelbrain parcellation works")
-        
-        return True
-        
-    except ImportError:
-        print("ℹ️  Eelbrain not available, skipping integration test")
-        return True  # Not a failure if eelbrain is not installed
-    except Exception as e:
-        print(f"❌ Eelbrain integration error: {e}")
-        return False
+
+def test_example_script(name):
+    """Test that an example from the example script runs without errors."""
+    import example
+
+    getattr(example, name)()
+
+
+def _run_without_pytest():
+    """Run the checks of this script directly (without the test suite modules)."""
+    checks = [
+        (check.__name__, check)
+        for check in (
+            test_package_structure,
+            test_package_imports,
+            test_basic_functionality,
+            test_build_system,
+        )
+    ]
+    checks += [
+        (f"test_example_script[{name}]", functools.partial(test_example_script, name))
+        for name in EXAMPLES
+    ]
+
+    # Load each MNE sample dataset only once (tests/conftest.py does this
+    # under pytest)
+    from unittest import mock
+    from eelbrain import datasets
+
+    load = functools.lru_cache(maxsize=None)(datasets.get_mne_sample)
+    failed = []
+    with mock.patch.object(
+        datasets, "get_mne_sample", lambda *args, **kwargs: load(*args, **kwargs).copy()
+    ):
+        for check_name, check in checks:
+            try:
+                check()
+            except Exception as e:
+                print(f"❌ {check_name}: {e}")
+                failed.append(check_name)
+            else:
+                print(f"✅ {check_name}")
+    return not failed
 
 
 def main():
     """Run all validation tests."""
     print("🔍 LIVENEURON PACKAGE VALIDATION")
     print("=" * 60)
-    
-    tests = [
-        ("Package Structure", test_package_structure),
-        ("Package Imports", test_package_imports),
-        ("Basic Functionality", test_basic_functionality),
-        ("Dependencies", test_dependencies),
-        ("Build System", test_build_system),
-        ("Example Script", test_example_script),
-        ("Eelbrain Integration", test_eelbrain_integration),
-    ]
-    
-    results = []
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ {test_name} failed with exception: {e}")
-            results.append((test_name, False))
-    
-    # Summary
-    print("\n" + "=" * 60)
-    print("VALIDATION SUMMARY")
-    print("=" * 60)
-    
-    passed = 0
-    total = len(results)
-    
-    for test_name, result in results:
-        status = "✅ PASS" if result else "❌ FAIL"
-        print(f"{test_name:.<30} {status}")
-        if result:
-            passed += 1
-    
+
+    try:
+        import pytest
+    except ImportError:
+        print("⚠️ pytest not installed, skipping the test suite modules")
+        success = _run_without_pytest()
+    else:
+        args = ["--tb=short", __file__, *map(str, SUITE_MODULES)]
+        success = pytest.main(args) == pytest.ExitCode.OK
+
     print("\n" + "=" * 60)
-    if passed == total:
-        print(f"🎉 ALL TESTS PASSED! ({passed}/{total})")
+    if success:
+        print("🎉 ALL TESTS PASSED!")
         print("✅ LiveNeuron package is ready for distribution!")
-        print("\nNext steps:")
-        print("1. Update GitHub URLs in pyproject.toml and README.md")
-        print("2. Create GitHub repository")
-        print("3. Push code to GitHub")
-        print("4. Test installation: pip install git+https://github.com/your-username/LiveNeuron.git")
-        print("\n💡 Key LiveNeuron features validated:")
-        print("   • Interactive 2D brain visualization")
-        print("   • Butterfly plot with source time series")
-        print("   • Support for vector data with arrows")
-        print("   • Customizable colormaps and thresholds")
-        print("   • Jupyter notebook integration")
-        print("   • Eelbrain NDVar compatibility")
         return True
     else:
-        print(f"❌ SOME TESTS FAILED ({passed}/{total} passed)")
+        print("❌ SOME TESTS FAILED")
         print("Please fix the issues above before distribution.")
         return False
 
 
 if __name__ == "__main__":
     success = main()
-    sys.exit(0 if success else 1) 
\ No newline at end of file
+    sys.exit(0 if success else 1)